@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Render test result summaries from artifact manager JSON
+
+Usage: render.py <kind> [<kind> ...] < results.json
+       render.py --all < results.json
+
+The JSON document is read from stdin once and one summary is emitted per
+requested kind, so a workflow step can render several sections without
+starting a new interpreter for each one.
+
+Only the standard library is required, so workflows run this with
+`python3 -S` to skip site-packages initialisation. When run without -S,
+orjson is used if it is installed.
+"""
+
+import sys
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# kind -> (json_key, label, time_label)
+# A label of None emits the bare status value (used for shell comparisons).
+SPECS = {
+    "deployment-verification": (
+        "deployment_verification",
+        "Deployment Verification",
+        "Verification Time",
+    ),
+    "functionality-test": (
+        "functionality_test",
+        "Functionality Test",
+        "Functionality Test Time",
+    ),
+    "health-check": ("health_check", "Health Check", "Health Check Time"),
+    "integration-status": ("integration", None, None),
+    "rollback-functionality": (
+        "rollback_functionality_test",
+        "Rollback Functionality Test",
+        "Functionality Test Time",
+    ),
+    "rollback-health": (
+        "rollback_health_check",
+        "Rollback Health Check",
+        "Health Check Time",
+    ),
+    "rollback-verification": (
+        "rollback_verification",
+        "Rollback Verification",
+        "Verification Time",
+    ),
+}
+
+
+def render(kind, data):
+    """Return the summary lines for one kind"""
+    key, label, time_label = SPECS[kind]
+    try:
+        section = data.get(key, {})
+        status = section.get("status", "unknown")
+        if label is None:
+            return [str(status)]
+        lines = [f"- **{label}**: {status}"]
+        if "timestamp" in section:
+            lines.append(f"- **{time_label}**: {section['timestamp']}")
+        return lines
+    except Exception:
+        return ["unknown" if label is None else f"- **{label}**: unknown"]
+
+
+def main(argv):
+    kinds = list(SPECS) if argv == ["--all"] else argv
+    unknown = [kind for kind in kinds if kind not in SPECS]
+    if not kinds or unknown:
+        print(f"Usage: render.py <{'|'.join(SPECS)}>... | --all", file=sys.stderr)
+        return 2
+
+    try:
+        data = json_loads(sys.stdin.buffer.read())
+    except Exception:
+        data = None
+
+    lines = [line for kind in kinds for line in render(kind, data)]
+    sys.stdout.buffer.write(("\n".join(lines) + "\n").encode("utf-8"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
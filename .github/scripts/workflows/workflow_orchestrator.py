@@ -3,10 +3,176 @@
 Workflow Orchestrator - Comprehensive workflow dependency validation and state management
 """
 import json
+import os
 import subprocess
 import sys
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+
+# Defaults for the repository variables read by the consistency checks. They are
+# merged under the fetched variables once, so each check can pull its values
+# with a single itemgetter call instead of a chain of dict.get(key, default).
+VARIABLE_DEFAULTS = {
+    'DEPLOYED_ARTIFACT_DIGEST': '',
+    'DEPLOYMENT_STATUS': '',
+    'DEPLOYMENT_IN_PROGRESS': 'false',
+    'DEPLOYMENT_STARTED_AT': '',
+    'CIRCUIT_BREAKER_STATUS': 'closed',
+    'RECOVERY_FAILURE_COUNT': '0',
+    'DEPLOYMENT_FAILURE_COUNT': '0',
+    'CIRCUIT_BREAKER_THRESHOLD': '3',
+    'DEPLOYMENT_CIRCUIT_BREAKER_THRESHOLD': '5',
+    'BACKUP_ARTIFACT_DIGEST': '',
+    'RECOVERY_SESSION_ID': '',
+    'RECOVERY_START_TIME': '',
+    'LAST_HEALTH_CHECK_STATUS': '',
+}
+
+# fromisoformat accepts the trailing 'Z' natively from 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp with a UTC offset, or return None if it is invalid"""
+    if not _FROMISOFORMAT_ACCEPTS_Z:
+        value = value.replace('Z', '+00:00')
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # Naive timestamps cannot be compared against the report clock
+    return parsed if parsed.tzinfo is not None else None
+
+
+def _deployment_consistency(values: Tuple[str, ...], now: datetime) -> Tuple[List[str], Dict]:
+    """Check deployment state consistency"""
+    deployed_digest, deployment_status, deployment_in_progress, deployment_started_at = values
+    issues = []
+    
+    if deployment_in_progress == 'true' and deployment_started_at:
+        # Check if deployment has been running too long (>30 minutes)
+        started_time = parse_timestamp(deployment_started_at)
+        if started_time is None:
+            issues.append('Invalid deployment start timestamp')
+        elif (now - started_time).total_seconds() > 1800:
+            issues.append('Deployment has been in progress for over 30 minutes')
+    
+    if not deployed_digest and deployment_status == 'successful':
+        issues.append('Deployment marked successful but no artifact digest recorded')
+    
+    return issues, {
+        'deployed_digest': deployed_digest,
+        'deployment_status': deployment_status,
+        'deployment_in_progress': deployment_in_progress == 'true'
+    }
+
+
+def _circuit_breaker_consistency(values: Tuple[str, ...], now: datetime) -> Tuple[List[str], Dict]:
+    """Check circuit breaker state consistency"""
+    cb_status, *counts = values
+    recovery_failure_count, deployment_failure_count, recovery_threshold, deployment_threshold = map(int, counts)
+    issues = []
+    
+    # Check if circuit breaker should be open based on failure counts
+    should_be_open = (recovery_failure_count >= recovery_threshold or 
+                      deployment_failure_count >= deployment_threshold)
+    
+    if should_be_open and cb_status != 'open':
+        issues.append(f'Circuit breaker should be open (recovery: {recovery_failure_count}/{recovery_threshold}, deployment: {deployment_failure_count}/{deployment_threshold})')
+    
+    if cb_status == 'open' and not should_be_open:
+        issues.append('Circuit breaker is open but failure counts are below thresholds')
+    
+    return issues, {
+        'circuit_breaker_status': cb_status,
+        'recovery_failures': f'{recovery_failure_count}/{recovery_threshold}',
+        'deployment_failures': f'{deployment_failure_count}/{deployment_threshold}'
+    }
+
+
+def _artifact_consistency(values: Tuple[str, ...], now: datetime) -> Tuple[List[str], Dict]:
+    """Check artifact state consistency"""
+    deployed_digest, backup_digest = values
+    issues = []
+    
+    if deployed_digest and backup_digest and deployed_digest == backup_digest:
+        issues.append('Deployed and backup artifacts are the same')
+    
+    return issues, {
+        'deployed_digest': deployed_digest[:12] + '...' if deployed_digest else 'none',
+        'backup_digest': backup_digest[:12] + '...' if backup_digest else 'none'
+    }
+
+
+def _recovery_consistency(values: Tuple[str, ...], now: datetime) -> Tuple[List[str], Dict]:
+    """Check recovery state consistency"""
+    recovery_session, last_health_status, recovery_start = values
+    recovery_in_progress = bool(recovery_session)
+    issues = []
+    
+    if recovery_in_progress and recovery_start:
+        start_time = parse_timestamp(recovery_start)
+        if start_time is None:
+            issues.append('Invalid recovery start timestamp')
+        elif (now - start_time).total_seconds() > 900:  # 15 minutes
+            issues.append('Recovery session has been active for over 15 minutes')
+    
+    return issues, {
+        'recovery_in_progress': recovery_in_progress,
+        'last_health_status': last_health_status
+    }
+
+
+# Each check pulls its variables with one itemgetter call and returns (issues, details)
+ConsistencyCheck = namedtuple('ConsistencyCheck', 'name keys builder')
+
+CONSISTENCY_CHECKS = (
+    ConsistencyCheck('deployment_state',
+                     itemgetter('DEPLOYED_ARTIFACT_DIGEST', 'DEPLOYMENT_STATUS',
+                                'DEPLOYMENT_IN_PROGRESS', 'DEPLOYMENT_STARTED_AT'),
+                     _deployment_consistency),
+    ConsistencyCheck('circuit_breaker_state',
+                     itemgetter('CIRCUIT_BREAKER_STATUS', 'RECOVERY_FAILURE_COUNT',
+                                'DEPLOYMENT_FAILURE_COUNT', 'CIRCUIT_BREAKER_THRESHOLD',
+                                'DEPLOYMENT_CIRCUIT_BREAKER_THRESHOLD'),
+                     _circuit_breaker_consistency),
+    ConsistencyCheck('artifact_state',
+                     itemgetter('DEPLOYED_ARTIFACT_DIGEST', 'BACKUP_ARTIFACT_DIGEST'),
+                     _artifact_consistency),
+    ConsistencyCheck('recovery_state',
+                     itemgetter('RECOVERY_SESSION_ID', 'LAST_HEALTH_CHECK_STATUS', 'RECOVERY_START_TIME'),
+                     _recovery_consistency),
+)
+
+
+def json_loads(raw):
+    """Parse JSON text or bytes, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps_indented(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
 
 
 class WorkflowOrchestrator:
@@ -14,35 +180,137 @@ class WorkflowOrchestrator:
         self.repo = repo
         self.session_id = session_id
         self.workflow_states = {}
+        # Edges are tuples rather than sets so dependency issues are reported in declaration order
         self.dependency_graph = {
-            'ci': {'depends_on': [], 'triggers': ['integration-test']},
-            'integration-test': {'depends_on': ['ci'], 'triggers': ['deploy']},
-            'deploy': {'depends_on': ['integration-test'], 'triggers': ['health-monitor']},
-            'health-monitor': {'depends_on': [], 'triggers': ['recovery']},
-            'recovery': {'depends_on': ['health-monitor'], 'triggers': ['deploy']},
-            'manual-rollback': {'depends_on': [], 'triggers': []}
+            'ci': {'depends_on': (), 'triggers': ('integration-test',)},
+            'integration-test': {'depends_on': ('ci',), 'triggers': ('deploy',)},
+            'deploy': {'depends_on': ('integration-test',), 'triggers': ('health-monitor',)},
+            'health-monitor': {'depends_on': (), 'triggers': ('recovery',)},
+            'recovery': {'depends_on': ('health-monitor',), 'triggers': ('deploy',)},
+            'manual-rollback': {'depends_on': (), 'triggers': ()}
         }
         self.critical_workflows = ['ci', 'integration-test', 'deploy']
         self.monitoring_workflows = ['health-monitor', 'recovery']
         self.manual_workflows = ['manual-rollback']
+        self._api = self._create_api_session()
+        self._run_batch: Optional[Dict[str, List[Dict]]] = None
+        self._run_batch_lock = threading.Lock()
+        self._variables: Optional[Dict[str, str]] = None
+        self._now: Optional[datetime] = None
+    
+    def _create_api_session(self):
+        """Create a keep-alive GitHub REST session, or None to use the gh CLI"""
+        token = os.getenv('GH_TOKEN') or os.getenv('GITHUB_TOKEN')
+        if requests is None or not token or not self.repo:
+            return None
+        session = requests.Session()
+        session.headers.update({
+            'Authorization': f'Bearer {token}',
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28'
+        })
+        return session
+    
+    @staticmethod
+    def _normalize_run(run: Dict) -> Dict:
+        """Map a REST workflow run onto the field names used by `gh run list --json`"""
+        return {
+            'databaseId': run.get('id'),
+            'status': run.get('status'),
+            'conclusion': run.get('conclusion'),
+            'createdAt': run.get('created_at'),
+            'updatedAt': run.get('updated_at'),
+            'headSha': run.get('head_sha')
+        }
+    
+    def _api_get_runs(self, path: str, per_page: int) -> List[Dict]:
+        """GET a workflow runs listing from the REST API"""
+        response = self._api.get(f'{GITHUB_API_URL}/repos/{self.repo}/{path}',
+                                 params={'per_page': per_page}, timeout=30)
+        response.raise_for_status()
+        return json_loads(response.content).get('workflow_runs', [])
+    
+    def _get_run_batch(self) -> Dict[str, List[Dict]]:
+        """Fetch the most recent runs of all workflows in a single request, grouped by workflow"""
+        with self._run_batch_lock:
+            if self._run_batch is None:
+                batch: Dict[str, List[Dict]] = {}
+                for run in self._api_get_runs('actions/runs', 100):
+                    workflow = os.path.splitext(os.path.basename(run.get('path', '').split('@')[0]))[0]
+                    batch.setdefault(workflow, []).append(self._normalize_run(run))
+                self._run_batch = batch
+            return self._run_batch
     
     def get_workflow_runs(self, workflow: str, limit: int = 10) -> List[Dict]:
         """Get recent workflow runs"""
+        if self._api is not None:
+            try:
+                runs = self._get_run_batch().get(workflow, [])
+                if len(runs) >= limit:
+                    return runs[:limit]
+                # The shared batch may not reach back far enough for rarely run workflows
+                return [self._normalize_run(run) for run in
+                        self._api_get_runs(f'actions/workflows/{workflow}.yml/runs', limit)]
+            except Exception as e:
+                print(f"Warning: GitHub API request failed for {workflow}, falling back to gh: {e}", file=sys.stderr)
+        
         try:
             cmd = ['gh', 'run', 'list', '--workflow', f'{workflow}.yml', '--limit', str(limit), '--json', 'databaseId,status,conclusion,createdAt,updatedAt,headSha']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
             
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                return json_loads(result.stdout)
             else:
-                print(f"Warning: Could not get runs for workflow {workflow}: {result.stderr}")
+                print(f"Warning: Could not get runs for workflow {workflow}: {result.stderr.decode('utf-8', 'replace')}")
                 return []
         except Exception as e:
             print(f"Error getting workflow runs for {workflow}: {e}")
             return []
     
     def get_workflow_state(self, workflow: str) -> Dict:
-        """Get comprehensive workflow state"""
+        """Get comprehensive workflow state (cached per report)"""
+        state = self.workflow_states.get(workflow)
+        if state is None:
+            state = self.workflow_states[workflow] = self._build_workflow_state(workflow)
+        return state
+    
+    def get_workflow_scalars(self, workflow: str) -> Tuple[str, str, Optional[str]]:
+        """Get (health, status, conclusion) for a workflow without building its full state"""
+        state = self.workflow_states.get(workflow)
+        if state is not None:
+            return self._state_scalars(state)
+        
+        runs = self.get_workflow_runs(workflow, 5)
+        if not runs:
+            return 'unknown', 'unknown', None
+        latest_run = runs[0]
+        return self._derive_health(runs), latest_run.get('status', 'unknown'), latest_run.get('conclusion')
+    
+    @staticmethod
+    def _state_scalars(state: Dict) -> Tuple[str, str, Optional[str]]:
+        """Extract (health, status, conclusion) from a workflow state dict"""
+        return state['health'], state['status'], state.get('conclusion')
+    
+    @staticmethod
+    def _derive_health(runs: List[Dict]) -> str:
+        """Determine workflow health based on recent runs in a single pass"""
+        concluded = succeeded = 0
+        for run in runs[:3]:
+            conclusion = run.get('conclusion')
+            if conclusion:
+                concluded += 1
+                succeeded += conclusion == 'success'
+        
+        if not concluded:
+            return 'unknown'
+        if succeeded == concluded:
+            return 'healthy'
+        if succeeded:
+            return 'degraded'
+        return 'unhealthy'
+    
+    def _build_workflow_state(self, workflow: str) -> Dict:
+        """Fetch recent runs and derive the workflow state"""
         runs = self.get_workflow_runs(workflow, 5)
         
         if not runs:
@@ -55,24 +323,12 @@ class WorkflowOrchestrator:
         
         latest_run = runs[0]
         
-        # Determine workflow health based on recent runs
-        recent_conclusions = [run.get('conclusion') for run in runs[:3] if run.get('conclusion')]
-        
-        if not recent_conclusions:
-            health = 'unknown'
-        elif all(c == 'success' for c in recent_conclusions):
-            health = 'healthy'
-        elif any(c == 'success' for c in recent_conclusions):
-            health = 'degraded'
-        else:
-            health = 'unhealthy'
-        
         return {
             'status': latest_run.get('status', 'unknown'),
             'conclusion': latest_run.get('conclusion'),
             'last_run': latest_run,
             'recent_runs': runs,
-            'health': health,
+            'health': self._derive_health(runs),
             'last_updated': latest_run.get('updatedAt'),
             'head_sha': latest_run.get('headSha')
         }
@@ -88,32 +344,34 @@ class WorkflowOrchestrator:
         dependencies = self.dependency_graph[workflow]['depends_on']
         
         for dep in dependencies:
-            dep_state = self.get_workflow_state(dep)
+            dep_health, dep_status, dep_conclusion = self.get_workflow_scalars(dep)
             
-            if dep_state['health'] == 'unhealthy':
+            if dep_health == 'unhealthy':
                 issues.append(f"Dependency {dep} is unhealthy")
-            elif dep_state['status'] == 'in_progress':
+            elif dep_status == 'in_progress':
                 issues.append(f"Dependency {dep} is still running")
-            elif dep_state['conclusion'] == 'failure':
+            elif dep_conclusion == 'failure':
                 issues.append(f"Dependency {dep} failed in last run")
         
         return len(issues) == 0, issues
     
-    def check_workflow_sequencing(self) -> Dict[str, Dict]:
-        """Check if workflows are running in proper sequence"""
+    def check_workflow_sequencing(self, states: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+        """Check if workflows are running in proper sequence, reusing precomputed states if given"""
+        if states is None:
+            states = {workflow: self.get_workflow_state(workflow) for workflow in self.dependency_graph}
         sequencing_issues = {}
         
         for workflow, config in self.dependency_graph.items():
-            state = self.get_workflow_state(workflow)
+            state = states[workflow]
             issues = []
             
             # Check if workflow is running when dependencies haven't completed
             if state['status'] == 'in_progress':
                 for dep in config['depends_on']:
-                    dep_state = self.get_workflow_state(dep)
-                    if dep_state['status'] == 'in_progress':
+                    _, dep_status, dep_conclusion = self._state_scalars(states[dep])
+                    if dep_status == 'in_progress':
                         issues.append(f"Running concurrently with dependency {dep}")
-                    elif dep_state['conclusion'] != 'success':
+                    elif dep_conclusion != 'success':
                         issues.append(f"Running despite dependency {dep} not successful")
             
             if issues:
@@ -124,136 +382,77 @@ class WorkflowOrchestrator:
         
         return sequencing_issues
     
+    def _current_time(self) -> datetime:
+        """Reference time for age checks, fixed for the duration of a report"""
+        return self._now or datetime.now(timezone.utc)
+    
+    def _get_variables(self) -> Optional[Dict[str, str]]:
+        """Get repository variables over VARIABLE_DEFAULTS, fetching them at most once per report"""
+        if self._variables is None:
+            fetched = self._api_list_variables() if self._api is not None else None
+            
+            if fetched is None:
+                cmd = ['gh', 'variable', 'list', '--repo', self.repo, '--json', 'name,value']
+                result = subprocess.run(cmd, capture_output=True, timeout=30)
+                
+                if result.returncode != 0:
+                    return None
+                
+                fetched = json_loads(result.stdout)
+            
+            variables = dict(VARIABLE_DEFAULTS)
+            variables.update((var['name'], var['value']) for var in fetched)
+            self._variables = variables
+        return self._variables
+    
+    def _api_list_variables(self) -> Optional[List[Dict]]:
+        """List repository variables over the shared REST session, or None on failure"""
+        url = f'{GITHUB_API_URL}/repos/{self.repo}/actions/variables'
+        params: Optional[Dict] = {'per_page': 30}
+        variables: List[Dict] = []
+        try:
+            while url:
+                response = self._api.get(url, params=params, timeout=30)
+                response.raise_for_status()
+                variables.extend(json_loads(response.content).get('variables', []))
+                # The next-page link already carries the query string
+                url = response.links.get('next', {}).get('url')
+                params = None
+        except Exception as e:
+            print(f"Warning: GitHub API variable listing failed, falling back to gh: {e}", file=sys.stderr)
+            return None
+        return variables
+    
     def get_system_state_consistency(self) -> Dict:
         """Check consistency of system state across workflows"""
         try:
             # Get key state variables
-            cmd = ['gh', 'variable', 'list', '--repo', self.repo, '--json', 'name,value']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode != 0:
+            variables = self._get_variables()
+            if variables is None:
                 return {'error': 'Could not retrieve system variables'}
             
-            variables = {var['name']: var['value'] for var in json.loads(result.stdout)}
-            
             # Check key consistency points
-            consistency_checks = {
-                'deployment_state': self._check_deployment_consistency(variables),
-                'circuit_breaker_state': self._check_circuit_breaker_consistency(variables),
-                'artifact_state': self._check_artifact_consistency(variables),
-                'recovery_state': self._check_recovery_consistency(variables)
-            }
+            now = self._current_time()
+            consistency_checks = {}
+            for check in CONSISTENCY_CHECKS:
+                issues, details = check.builder(check.keys(variables), now)
+                consistency_checks[check.name] = {
+                    'status': 'consistent' if not issues else 'inconsistent',
+                    'issues': issues,
+                    **details
+                }
             
             return consistency_checks
             
         except Exception as e:
             return {'error': f'State consistency check failed: {e}'}
     
-    def _check_deployment_consistency(self, variables: Dict[str, str]) -> Dict:
-        """Check deployment state consistency"""
-        deployed_digest = variables.get('DEPLOYED_ARTIFACT_DIGEST', '')
-        deployment_status = variables.get('DEPLOYMENT_STATUS', '')
-        deployment_in_progress = variables.get('DEPLOYMENT_IN_PROGRESS', 'false')
-        
-        issues = []
-        
-        if deployment_in_progress == 'true':
-            deployment_started_at = variables.get('DEPLOYMENT_STARTED_AT', '')
-            if deployment_started_at:
-                # Check if deployment has been running too long (>30 minutes)
-                try:
-                    started_time = datetime.fromisoformat(deployment_started_at.replace('Z', '+00:00'))
-                    if (datetime.now(timezone.utc) - started_time).total_seconds() > 1800:
-                        issues.append('Deployment has been in progress for over 30 minutes')
-                except:
-                    issues.append('Invalid deployment start timestamp')
-        
-        if not deployed_digest and deployment_status == 'successful':
-            issues.append('Deployment marked successful but no artifact digest recorded')
-        
-        return {
-            'status': 'consistent' if not issues else 'inconsistent',
-            'issues': issues,
-            'deployed_digest': deployed_digest,
-            'deployment_status': deployment_status,
-            'deployment_in_progress': deployment_in_progress == 'true'
-        }
-    
-    def _check_circuit_breaker_consistency(self, variables: Dict[str, str]) -> Dict:
-        """Check circuit breaker state consistency"""
-        cb_status = variables.get('CIRCUIT_BREAKER_STATUS', 'closed')
-        recovery_failure_count = int(variables.get('RECOVERY_FAILURE_COUNT', '0'))
-        deployment_failure_count = int(variables.get('DEPLOYMENT_FAILURE_COUNT', '0'))
-        recovery_threshold = int(variables.get('CIRCUIT_BREAKER_THRESHOLD', '3'))
-        deployment_threshold = int(variables.get('DEPLOYMENT_CIRCUIT_BREAKER_THRESHOLD', '5'))
-        
-        issues = []
-        
-        # Check if circuit breaker should be open based on failure counts
-        should_be_open = (recovery_failure_count >= recovery_threshold or 
-                         deployment_failure_count >= deployment_threshold)
-        
-        if should_be_open and cb_status != 'open':
-            issues.append(f'Circuit breaker should be open (recovery: {recovery_failure_count}/{recovery_threshold}, deployment: {deployment_failure_count}/{deployment_threshold})')
-        
-        if cb_status == 'open' and not should_be_open:
-            issues.append('Circuit breaker is open but failure counts are below thresholds')
-        
-        return {
-            'status': 'consistent' if not issues else 'inconsistent',
-            'issues': issues,
-            'circuit_breaker_status': cb_status,
-            'recovery_failures': f'{recovery_failure_count}/{recovery_threshold}',
-            'deployment_failures': f'{deployment_failure_count}/{deployment_threshold}'
-        }
-    
-    def _check_artifact_consistency(self, variables: Dict[str, str]) -> Dict:
-        """Check artifact state consistency"""
-        deployed_digest = variables.get('DEPLOYED_ARTIFACT_DIGEST', '')
-        backup_digest = variables.get('BACKUP_ARTIFACT_DIGEST', '')
-        
-        issues = []
-        
-        if deployed_digest and backup_digest and deployed_digest == backup_digest:
-            issues.append('Deployed and backup artifacts are the same')
-        
-        return {
-            'status': 'consistent' if not issues else 'inconsistent',
-            'issues': issues,
-            'deployed_digest': deployed_digest[:12] + '...' if deployed_digest else 'none',
-            'backup_digest': backup_digest[:12] + '...' if backup_digest else 'none'
-        }
-    
-    def _check_recovery_consistency(self, variables: Dict[str, str]) -> Dict:
-        """Check recovery state consistency"""
-        recovery_session = variables.get('RECOVERY_SESSION_ID', '')
-        recovery_in_progress = bool(recovery_session)
-        last_health_status = variables.get('LAST_HEALTH_CHECK_STATUS', '')
-        
-        issues = []
-        
-        if recovery_in_progress:
-            recovery_start = variables.get('RECOVERY_START_TIME', '')
-            if recovery_start:
-                try:
-                    start_time = datetime.fromisoformat(recovery_start.replace('Z', '+00:00'))
-                    if (datetime.now(timezone.utc) - start_time).total_seconds() > 900:  # 15 minutes
-                        issues.append('Recovery session has been active for over 15 minutes')
-                except:
-                    issues.append('Invalid recovery start timestamp')
-        
-        return {
-            'status': 'consistent' if not issues else 'inconsistent',
-            'issues': issues,
-            'recovery_in_progress': recovery_in_progress,
-            'last_health_status': last_health_status
-        }
-    
     def generate_orchestration_report(self) -> Dict:
         """Generate comprehensive orchestration report"""
+        self._now = datetime.now(timezone.utc)
         report = {
             'session_id': self.session_id,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': self._now.isoformat(),
             'workflow_states': {},
             'dependency_validation': {},
             'sequencing_issues': {},
@@ -261,9 +460,16 @@ class WorkflowOrchestrator:
             'recommendations': []
         }
         
-        # Get workflow states
-        for workflow in self.dependency_graph.keys():
-            report['workflow_states'][workflow] = self.get_workflow_state(workflow)
+        # Get workflow states, fetching them concurrently so the gh calls overlap.
+        # Later dependency and sequencing checks are served from the same cache.
+        self.workflow_states = {}
+        self._run_batch = None
+        self._variables = None
+        workflows = list(self.dependency_graph.keys())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            states = list(executor.map(self._build_workflow_state, workflows))
+        self.workflow_states.update(zip(workflows, states))
+        report['workflow_states'] = dict(self.workflow_states)
         
         # Validate dependencies
         for workflow in self.dependency_graph.keys():
@@ -274,7 +480,7 @@ class WorkflowOrchestrator:
             }
         
         # Check sequencing
-        report['sequencing_issues'] = self.check_workflow_sequencing()
+        report['sequencing_issues'] = self.check_workflow_sequencing(report['workflow_states'])
         
         # Check system consistency
         report['system_consistency'] = self.get_system_state_consistency()
@@ -330,11 +536,10 @@ class WorkflowOrchestrator:
 
 
 if __name__ == "__main__":
-    import os
     repo = os.getenv('GITHUB_REPOSITORY')
     session_id = os.getenv('ORCHESTRATION_SESSION_ID')
     
     orchestrator = WorkflowOrchestrator(repo, session_id)
     report = orchestrator.generate_orchestration_report()
     
-    print(json.dumps(report, indent=2))
+    sys.stdout.buffer.write(json_dumps_indented(report) + b'\n')
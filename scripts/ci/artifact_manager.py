@@ -12,52 +12,207 @@ Requirements: 1.1, 1.2, 1.3, 1.4, 1.5, 2.1
 """
 
 import argparse
+import copy
 import hashlib
 import json
 import os
+import random
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Manifest media types accepted when checking an image in the registry
+MANIFEST_MEDIA_TYPES = ", ".join(
+    (
+        "application/vnd.oci.image.index.v1+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.docker.distribution.manifest.v2+json",
+    )
+)
+
+# Docker digest format: sha256:64-character-hex-string
+DIGEST_PATTERN = re.compile(r"^sha256:[a-f0-9]{64}$")
+
+# Upper bound for the exponential backoff between registry checks (seconds).
+# Each wait is drawn uniformly from [0, delay] so concurrent jobs spread out.
+MAX_RETRY_DELAY = 60
+
+# Read size for hashing files on Pythons without hashlib.file_digest
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def utcnow_z() -> str:
+    """Return the current UTC time as an ISO 8601 string with a Z suffix"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def json_loads(raw):
+    """Parse JSON text or bytes, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class ArtifactManager:
     """Manages Docker artifact lifecycle and digest operations."""
 
+    # Batch operation name -> method that applies it to a loaded document
+    BATCH_OPERATIONS = {
+        "record-artifact": "_record_artifact",
+        "update-status": "_update_artifact_status",
+        "record-test-result": "_record_test_result",
+    }
+
     def __init__(self):
         self.artifacts_file = Path(".artifacts.json")
+        # (registry, repository) -> bearer token for the registry HTTP API
         self.registry_cache = {}
+        # HTTP session for registry checks, shared by validate_artifacts' workers
+        self._registry_session = None
+        self._registry_lock = threading.Lock()
+        # Set once the registry API is unreachable so later checks go to docker
+        self._registry_disabled = False
+        # Parsed artifacts file and the (mtime_ns, size, inode) it was read at
+        self._cache = None
+        self._cache_key = None
+        # Lookup tables for the document in _indexed (see _indexes)
+        self._indexed = None
+        self._by_commit = {}
+        self._by_digest = {}
+
+    def _file_key(self) -> Optional[Tuple[int, int, int]]:
+        """Return the (mtime_ns, size, inode) of the artifacts file, or None if missing.
+
+        Including the inode means an os.replace by another writer is seen
+        even when the new file has the same size and mtime.
+        """
+        try:
+            stat = self.artifacts_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
     def load_artifacts(self) -> Dict:
-        """Load existing artifact metadata from file."""
-        if self.artifacts_file.exists():
+        """Load existing artifact metadata from file.
+
+        The parsed document is reused until the file's mtime, size or inode
+        changes, so repeated lookups cost a stat() instead of a full re-parse.
+
+        A file that is not valid JSON is moved aside and the process exits
+        with status 2, rather than continuing with an empty history that the
+        next save would write over it.
+        """
+        key = self._file_key()
+        if key is not None:
+            if self._cache is not None and key == self._cache_key:
+                return self._cache
             try:
-                with open(self.artifacts_file, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                with open(self.artifacts_file, "rb") as f:
+                    raw = f.read()
+            except IOError as e:
                 print(f"Warning: Could not load artifacts file: {e}", file=sys.stderr)
+                return {"artifacts": {}, "metadata": {"version": "1.0"}}
+            try:
+                data = json_loads(raw)
+            except ValueError as e:
+                self._quarantine_corrupt_file(e)
+            self._cache = data
+            self._cache_key = key
+            return data
         return {"artifacts": {}, "metadata": {"version": "1.0"}}
 
+    def _quarantine_corrupt_file(self, error: Exception) -> None:
+        """Move an unparseable artifacts file aside and exit with status 2."""
+        corrupt_file = self.artifacts_file.with_name(
+            f"{self.artifacts_file.name}.corrupt-{time.time_ns()}"
+        )
+        try:
+            os.replace(self.artifacts_file, corrupt_file)
+            location = f"moved to {corrupt_file.absolute()}"
+        except OSError as e:
+            location = f"left in place ({e})"
+        print(
+            f"Error: Artifacts file {self.artifacts_file} is not valid JSON ({error}); {location}",
+            file=sys.stderr,
+        )
+        raise SystemExit(2)
+
     def save_artifacts(self, data: Dict) -> None:
-        """Save artifact metadata to file."""
+        """Save artifact metadata to file.
+
+        The document is written to a temporary file next to the artifacts file
+        and moved into place, so an interrupted save never leaves a truncated
+        file behind. Keys are written in insertion order.
+        """
+        tmp_file = self.artifacts_file.with_name(self.artifacts_file.name + ".tmp")
         try:
-            with open(self.artifacts_file, "w") as f:
-                json.dump(data, f, indent=2, sort_keys=True)
+            with open(tmp_file, "w") as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.artifacts_file)
         except IOError as e:
             print(f"Error: Could not save artifacts file: {e}", file=sys.stderr)
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             sys.exit(1)
 
+        self._cache = data
+        self._cache_key = self._file_key()
+        # The saved document may have been mutated in place; rebuild on demand
+        self._indexed = None
+
+    def _indexes(self, data: Dict) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+        """Return (by_commit, by_digest) lookup tables for a loaded document.
+
+        The tables are built once per loaded document. by_commit lists artifact
+        IDs in file order and by_digest keeps the first artifact with each
+        digest, so lookups return the same entry a linear scan would.
+        """
+        if self._indexed is not data:
+            by_commit = {}
+            by_digest = {}
+            for artifact_id, artifact_info in data.get("artifacts", {}).items():
+                by_commit.setdefault(artifact_info.get("commit"), []).append(artifact_id)
+                by_digest.setdefault(artifact_info.get("digest"), artifact_id)
+            self._by_commit = by_commit
+            self._by_digest = by_digest
+            self._indexed = data
+        return self._by_commit, self._by_digest
+
+    def _find_by_digest(self, data: Dict, digest: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """Return (artifact_id, artifact_info) for a digest, or (None, None)."""
+        _, by_digest = self._indexes(data)
+        artifact_id = by_digest.get(digest)
+        if artifact_id is None:
+            return None, None
+        return artifact_id, data["artifacts"][artifact_id]
+
     def validate_digest(self, digest: str) -> bool:
         """Validate that a digest follows the expected SHA256 format."""
         if not digest:
             return False
 
-        # Docker digest format: sha256:64-character-hex-string
-        pattern = r"^sha256:[a-f0-9]{64}$"
-        return bool(re.match(pattern, digest))
+        return DIGEST_PATTERN.match(digest) is not None
 
     def validate_registry_access(self, registry: str, repository: str) -> bool:
         """Validate that we can access the container registry."""
@@ -78,10 +233,11 @@ class ArtifactManager:
         data = self.load_artifacts()
 
         # Look for existing artifact by commit
-        for artifact_id, artifact_info in data.get("artifacts", {}).items():
+        by_commit, _ = self._indexes(data)
+        for artifact_id in by_commit.get(commit, ()):
+            artifact_info = data["artifacts"][artifact_id]
             if (
-                artifact_info.get("commit") == commit
-                and artifact_info.get("registry") == registry
+                artifact_info.get("registry") == registry
                 and artifact_info.get("repository") == repository
             ):
                 return artifact_info.get("digest")
@@ -92,11 +248,23 @@ class ArtifactManager:
         self, digest: str, commit: str, registry: str, repository: str
     ) -> None:
         """Record a new artifact with its metadata."""
+        data = self.load_artifacts()
+        self._record_artifact(data, digest, commit, registry, repository)
+        self.save_artifacts(data)
+
+    def _record_artifact(
+        self, data: Dict, digest: str, commit: str, registry: str, repository: str
+    ) -> bool:
+        """Add an artifact to a loaded document without saving it.
+
+        Returns:
+            True, since the document is always modified
+        """
         if not self.validate_digest(digest):
             print(f"Error: Invalid digest format: {digest}", file=sys.stderr)
             sys.exit(1)
 
-        data = self.load_artifacts()
+        now = utcnow_z()
 
         # Create unique artifact ID
         artifact_id = f"{commit[:8]}-{digest.split(':')[1][:12]}"
@@ -107,15 +275,17 @@ class ArtifactManager:
             "commit": commit,
             "registry": registry,
             "repository": repository,
-            "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "created_at": now,
             "status": "created",
         }
+        # The lookup tables no longer cover every artifact
+        self._indexed = None
 
         # Update metadata
-        data["metadata"]["last_updated"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        data["metadata"]["last_updated"] = now
 
-        self.save_artifacts(data)
         print(f"Recorded artifact: {artifact_id} -> {digest}")
+        return True
 
     def get_digest_for_commit(self, commit: str) -> Optional[str]:
         """Get the digest for a specific commit."""
@@ -126,26 +296,102 @@ class ArtifactManager:
         print(f"DEBUG: Artifacts file path: {self.artifacts_file.absolute()}", file=sys.stderr)
         print(f"DEBUG: File exists: {self.artifacts_file.exists()}", file=sys.stderr)
         print(f"DEBUG: Number of artifacts: {len(data.get('artifacts', {}))}", file=sys.stderr)
-        
-        for artifact_id, artifact_info in data.get("artifacts", {}).items():
-            artifact_commit = artifact_info.get("commit")
-            print(f"DEBUG: Checking artifact {artifact_id}, commit: {artifact_commit}", file=sys.stderr)
-            if artifact_commit == commit:
-                digest = artifact_info.get("digest")
-                print(f"DEBUG: Match found! Digest: {digest}", file=sys.stderr)
-                return digest
+
+        by_commit, _ = self._indexes(data)
+        for artifact_id in by_commit.get(commit, ()):
+            digest = data["artifacts"][artifact_id].get("digest")
+            print(f"DEBUG: Match found in artifact {artifact_id}! Digest: {digest}", file=sys.stderr)
+            return digest
 
         print(f"DEBUG: No match found after checking all artifacts", file=sys.stderr)
         return None
 
+    def _get_registry_session(self):
+        """Return the shared registry HTTP session, or None if it can't be used."""
+        if requests is None or self._registry_disabled:
+            return None
+        with self._registry_lock:
+            if self._registry_session is None:
+                self._registry_session = requests.Session()
+            return self._registry_session
+
+    def _registry_token(self, session, registry: str, challenge: str) -> Optional[str]:
+        """Fetch a pull token for a registry's Bearer WWW-Authenticate challenge.
+
+        The GitHub token is only sent to GHCR's own auth endpoint; any other
+        registry gets an anonymous token request, since the realm URL is
+        whatever host that registry names.
+        """
+        params = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+        realm = params.pop("realm", None)
+        if not realm:
+            return None
+
+        auth = None
+        if registry == "ghcr.io" and realm.startswith("https://ghcr.io/"):
+            token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
+            if token:
+                auth = (os.getenv("GITHUB_ACTOR", "token"), token)
+        response = session.get(realm, params=params, auth=auth, timeout=10)
+        if response.status_code != 200:
+            return None
+        body = response.json()
+        return body.get("token") or body.get("access_token")
+
+    def registry_has_manifest(self, digest: str, registry: str, repository: str) -> Optional[bool]:
+        """Check for a manifest with one HEAD request to the registry's v2 API.
+
+        Returns True when the registry confirms the manifest exists and False
+        when it answers 404. Returns None when the API can't answer (requests
+        not installed, network or auth failure, other statuses) so callers
+        can fall back to the docker CLI.
+        """
+        session = self._get_registry_session()
+        if session is None:
+            return None
+
+        # Docker requires repository names to be lowercase
+        repository_lower = repository.lower()
+        url = f"https://{registry}/v2/{repository_lower}/manifests/{digest}"
+        headers = {"Accept": MANIFEST_MEDIA_TYPES}
+        cache_key = (registry, repository_lower)
+
+        try:
+            if cache_key in self.registry_cache:
+                headers["Authorization"] = f"Bearer {self.registry_cache[cache_key]}"
+            response = session.head(url, headers=headers, timeout=10)
+
+            if response.status_code == 401:
+                token = self._registry_token(session, registry, response.headers.get("WWW-Authenticate", ""))
+                if not token:
+                    return None
+                self.registry_cache[cache_key] = token
+                headers["Authorization"] = f"Bearer {token}"
+                response = session.head(url, headers=headers, timeout=10)
+
+            if response.status_code == 200:
+                return True
+            if response.status_code == 404:
+                return False
+            return None
+        except (requests.RequestException, ValueError) as e:
+            # Don't retry HTTP for the rest of this run; docker covers it
+            print(f"Registry API check unavailable: {e}", file=sys.stderr)
+            self._registry_disabled = True
+            return None
+
     def validate_artifact_exists(
         self, digest: str, registry: str, repository: str
     ) -> bool:
-        """Validate that an artifact exists in the registry."""
+        """Validate that an artifact exists in the registry.
+
+        Each attempt first asks the registry's HTTP API with a single HEAD
+        request and only spawns docker when the API can't give an answer; a
+        404 from the API goes straight to the retry backoff.
+        """
         if not self.validate_digest(digest):
             return False
 
-        import time
         max_retries = 8  # Increased from 5 to allow more time for GHCR propagation
         retry_delay = 2  # seconds
         
@@ -153,80 +399,121 @@ class ArtifactManager:
         repository_lower = repository.lower()
         
         for attempt in range(max_retries):
-            try:
-                # Use docker buildx imagetools inspect for better registry compatibility
-                cmd = ["docker", "buildx", "imagetools", "inspect", f"{registry}/{repository_lower}@{digest}"]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                
-                if result.returncode == 0:
-                    print(f"✓ Artifact validation successful on attempt {attempt + 1}", file=sys.stderr)
-                    return True
-                    
-                # If not found and not last attempt, wait before retry
-                if attempt < max_retries - 1:
-                    print(f"Attempt {attempt + 1}/{max_retries} failed, retrying in {retry_delay}s...", file=sys.stderr)
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    # Last attempt failed
-                    print(f"Attempt {attempt + 1}/{max_retries} failed (final attempt)", file=sys.stderr)
-                    if result.stderr:
-                        print(f"Error output: {result.stderr.strip()}", file=sys.stderr)
-                    
-            except subprocess.TimeoutExpired:
-                if attempt < max_retries - 1:
-                    print(f"Timeout on attempt {attempt + 1}/{max_retries}, retrying in {retry_delay}s...", file=sys.stderr)
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    print(f"Timeout on attempt {attempt + 1}/{max_retries} (final attempt)", file=sys.stderr)
-                    
-            except subprocess.SubprocessError as e:
-                print(f"Subprocess error: {e}", file=sys.stderr)
-                return False
-                
+            found = self.registry_has_manifest(digest, registry, repository)
+            if found:
+                print(f"✓ Artifact validation successful on attempt {attempt + 1}", file=sys.stderr)
+                return True
+
+            error_output = None
+            if found is False:
+                # The registry answered 404; the image may still be propagating
+                failure = f"Attempt {attempt + 1}/{max_retries} failed"
+            else:
+                try:
+                    # Use docker buildx imagetools inspect for better registry compatibility
+                    cmd = ["docker", "buildx", "imagetools", "inspect", f"{registry}/{repository_lower}@{digest}"]
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+
+                    if result.returncode == 0:
+                        print(f"✓ Artifact validation successful on attempt {attempt + 1}", file=sys.stderr)
+                        return True
+                    failure = f"Attempt {attempt + 1}/{max_retries} failed"
+                    error_output = result.stderr
+
+                except subprocess.TimeoutExpired:
+                    failure = f"Timeout on attempt {attempt + 1}/{max_retries}"
+
+                except subprocess.SubprocessError as e:
+                    print(f"Subprocess error: {e}", file=sys.stderr)
+                    return False
+
+            # If not found and not last attempt, wait before retry
+            if attempt < max_retries - 1:
+                sleep_for = random.uniform(0, retry_delay)
+                print(f"{failure}, retrying in {sleep_for:.1f}s...", file=sys.stderr)
+                time.sleep(sleep_for)
+                retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+            else:
+                # Last attempt failed
+                print(f"{failure} (final attempt)", file=sys.stderr)
+                if error_output:
+                    print(f"Error output: {error_output.strip()}", file=sys.stderr)
+
         return False
 
+    def validate_artifacts(self, items: List[Dict]) -> List[bool]:
+        """Validate several artifacts concurrently.
+
+        Args:
+            items: Dicts with "digest", "registry" and "repository" keys
+
+        Returns:
+            One result per item, in the same order
+        """
+        if not items:
+            return []
+        # Create the shared session up front rather than racing in the workers
+        self._get_registry_session()
+        # Checks spend their time waiting on docker and the network, so
+        # threads let the retry backoff of each artifact overlap
+        with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+            return list(
+                executor.map(
+                    lambda item: self.validate_artifact_exists(
+                        item["digest"], item["registry"], item["repository"]
+                    ),
+                    items,
+                )
+            )
+
     def update_artifact_status(
         self, digest: str, status: str, timestamp: str = None
     ) -> None:
         """Update the status of an existing artifact."""
+        data = self.load_artifacts()
+        if self._update_artifact_status(data, digest, status, timestamp):
+            self.save_artifacts(data)
+
+    def _update_artifact_status(
+        self, data: Dict, digest: str, status: str, timestamp: str = None
+    ) -> bool:
+        """Update an artifact's status in a loaded document without saving it.
+
+        Returns:
+            True if the document was modified
+        """
         if not self.validate_digest(digest):
             print(f"Error: Invalid digest format: {digest}", file=sys.stderr)
             sys.exit(1)
 
-        data = self.load_artifacts()
-
         # Find artifact by digest
-        artifact_found = False
-        for artifact_id, artifact_info in data.get("artifacts", {}).items():
-            if artifact_info.get("digest") == digest:
-                artifact_info["status"] = status
-                artifact_info["status_updated_at"] = (
-                    timestamp or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-                )
-                artifact_found = True
-                print(f"Updated artifact {artifact_id} status to: {status}")
-                break
-
-        if not artifact_found:
+        artifact_id, artifact_info = self._find_by_digest(data, digest)
+        if artifact_info is None:
             print(f"Warning: Artifact with digest {digest} not found", file=sys.stderr)
-            return
+            return False
 
-        # Update metadata
-        data["metadata"]["last_updated"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        # Re-setting the same status (e.g. a retried CI step) is a no-op
+        if artifact_info.get("status") == status and (
+            timestamp is None or timestamp == artifact_info.get("status_updated_at")
+        ):
+            print(f"Artifact {artifact_id} status already: {status}")
+            return False
 
-        self.save_artifacts(data)
+        now = utcnow_z()
+        artifact_info["status"] = status
+        artifact_info["status_updated_at"] = timestamp or now
+        print(f"Updated artifact {artifact_id} status to: {status}")
+
+        # Update metadata
+        data["metadata"]["last_updated"] = now
+        return True
 
     def get_artifact_status(self, digest: str) -> Optional[str]:
         """Get the current status of an artifact."""
-        data = self.load_artifacts()
-
-        for artifact_info in data.get("artifacts", {}).values():
-            if artifact_info.get("digest") == digest:
-                return artifact_info.get("status")
-
-        return None
+        _, artifact_info = self._find_by_digest(self.load_artifacts(), digest)
+        if artifact_info is None:
+            return None
+        return artifact_info.get("status")
 
     def record_test_result(
         self,
@@ -237,79 +524,114 @@ class ArtifactManager:
         details: str = None,
     ) -> None:
         """Record test results for an artifact."""
+        data = self.load_artifacts()
+        if self._record_test_result(data, digest, test_type, status, timestamp, details):
+            self.save_artifacts(data)
+
+    def _record_test_result(
+        self,
+        data: Dict,
+        digest: str,
+        test_type: str,
+        status: str,
+        timestamp: str,
+        details: str = None,
+    ) -> bool:
+        """Record a test result in a loaded document without saving it.
+
+        Returns:
+            True if the document was modified
+        """
         if not self.validate_digest(digest):
             print(f"Error: Invalid digest format: {digest}", file=sys.stderr)
             sys.exit(1)
 
-        data = self.load_artifacts()
-
         # Find artifact by digest
-        artifact_found = False
-        for artifact_id, artifact_info in data.get("artifacts", {}).items():
-            if artifact_info.get("digest") == digest:
-                # Initialize test_results if it doesn't exist
-                if "test_results" not in artifact_info:
-                    artifact_info["test_results"] = {}
-
-                # Record test result
-                artifact_info["test_results"][test_type] = {
-                    "status": status,
-                    "timestamp": timestamp,
-                    "details": details,
-                }
-
-                artifact_found = True
-                print(
-                    f"Recorded {test_type} test result for artifact {artifact_id}: {status}"
-                )
-                break
-
-        if not artifact_found:
+        artifact_id, artifact_info = self._find_by_digest(data, digest)
+        if artifact_info is None:
             print(f"Warning: Artifact with digest {digest} not found", file=sys.stderr)
-            return
+            return False
+
+        result = {
+            "status": status,
+            "timestamp": timestamp,
+            "details": details,
+        }
+        if artifact_info.get("test_results", {}).get(test_type) == result:
+            print(f"{test_type} test result for artifact {artifact_id} already recorded")
+            return False
+
+        # Initialize test_results if it doesn't exist
+        if "test_results" not in artifact_info:
+            artifact_info["test_results"] = {}
+
+        # Record test result
+        artifact_info["test_results"][test_type] = result
+
+        print(f"Recorded {test_type} test result for artifact {artifact_id}: {status}")
 
         # Update metadata
-        data["metadata"]["last_updated"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        data["metadata"]["last_updated"] = utcnow_z()
+        return True
+
+    def apply_batch(self, ops: List[Dict], line_numbers: Optional[List[int]] = None) -> None:
+        """Apply several write operations with a single load and save.
+
+        Each operation is a dict such as
+        {"op": "record-test-result", "args": {"digest": ..., "test_type": ...}}
+        where "op" is one of BATCH_OPERATIONS and "args" are the keyword
+        arguments of the matching method. Operations run in order against a
+        copy of the document, so nothing is written, and the cached document
+        is left untouched, if any of them fails.
+
+        line_numbers gives the input line of each operation for error
+        messages; by default operations are numbered from 1.
+        """
+        data = copy.deepcopy(self.load_artifacts())
+        changed = False
+
+        for index, op in enumerate(ops):
+            line = line_numbers[index] if line_numbers else index + 1
+            name = op.get("op") if isinstance(op, dict) else None
+            if name not in self.BATCH_OPERATIONS:
+                print(f"Error: Unknown batch operation on line {line}: {name}", file=sys.stderr)
+                sys.exit(1)
+            args = op.get("args", {})
+            if not isinstance(args, dict):
+                print(f"Error: Batch operation on line {line} has non-object args", file=sys.stderr)
+                sys.exit(1)
+            apply = getattr(self, self.BATCH_OPERATIONS[name])
+            try:
+                if apply(data, **args):
+                    changed = True
+            except TypeError as e:
+                print(f"Error: Invalid args for {name} on line {line}: {e}", file=sys.stderr)
+                sys.exit(1)
+            except SystemExit:
+                print(f"Error: Batch operation {name} on line {line} failed", file=sys.stderr)
+                raise
 
-        self.save_artifacts(data)
+        if changed:
+            self.save_artifacts(data)
 
     def get_test_results(self, digest: str) -> Optional[Dict]:
         """Get test results for an artifact."""
-        data = self.load_artifacts()
-
-        for artifact_info in data.get("artifacts", {}).values():
-            if artifact_info.get("digest") == digest:
-                return artifact_info.get("test_results", {})
-
-        return None
+        _, artifact_info = self._find_by_digest(self.load_artifacts(), digest)
+        if artifact_info is None:
+            return None
+        return artifact_info.get("test_results", {})
 
     def generate_content_hash(self, file_path: str) -> str:
         """Generate SHA256 hash of file content for validation."""
-        sha256_hash = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return f"sha256:{sha256_hash.hexdigest()}"
-        except IOError as e:
-            print(f"Error reading file {file_path}: {e}", file=sys.stderr)
-            sys.exit(1)
-        """Generate SHA256 hash of file content for validation."""
-        sha256_hash = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return f"sha256:{sha256_hash.hexdigest()}"
-        except IOError as e:
-            print(f"Error reading file {file_path}: {e}", file=sys.stderr)
-            sys.exit(1)
-        """Generate SHA256 hash of file content for validation."""
-        sha256_hash = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: hashes in C without a Python-level read loop
+                    sha256_hash = hashlib.file_digest(f, "sha256")
+                else:
+                    sha256_hash = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                        sha256_hash.update(chunk)
             return f"sha256:{sha256_hash.hexdigest()}"
         except IOError as e:
             print(f"Error reading file {file_path}: {e}", file=sys.stderr)
@@ -358,6 +680,16 @@ def main():
     )
     validate_parser.add_argument("--repository", required=True, help="Repository name")
 
+    # Validate several digests command
+    validate_many_parser = subparsers.add_parser(
+        "validate-digests", help="Validate several artifact digests in parallel"
+    )
+    validate_many_parser.add_argument(
+        "--input",
+        required=True,
+        help='JSON file with a list of {"digest", "registry", "repository"} objects',
+    )
+
     # Update status command
     status_parser = subparsers.add_parser(
         "update-status", help="Update artifact status"
@@ -400,6 +732,15 @@ def main():
     )
     hash_parser.add_argument("--file", required=True, help="File path to hash")
 
+    # Batch command
+    batch_parser = subparsers.add_parser(
+        "batch", help="Apply several write operations in one update"
+    )
+    batch_parser.add_argument(
+        "--ops-file",
+        help="File with one JSON operation per line (default: stdin)",
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -449,6 +790,22 @@ def main():
                 )
                 sys.exit(1)
 
+        elif args.command == "validate-digests":
+            with open(args.input, "rb") as f:
+                items = json_loads(f.read())
+            results = manager.validate_artifacts(items)
+            print(
+                json.dumps(
+                    [
+                        {"digest": item["digest"], "valid": valid}
+                        for item, valid in zip(items, results)
+                    ],
+                    indent=2,
+                )
+            )
+            if not all(results):
+                sys.exit(1)
+
         elif args.command == "update-status":
             manager.update_artifact_status(args.digest, args.status, args.timestamp)
 
@@ -475,6 +832,25 @@ def main():
                 )
                 sys.exit(1)
 
+        elif args.command == "batch":
+            if args.ops_file:
+                with open(args.ops_file, "r") as f:
+                    lines = f.readlines()
+            else:
+                lines = sys.stdin.readlines()
+            ops = []
+            line_numbers = []
+            for line_number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    ops.append(json_loads(line))
+                except ValueError as e:
+                    print(f"Error: Invalid JSON on batch line {line_number}: {e}", file=sys.stderr)
+                    sys.exit(1)
+                line_numbers.append(line_number)
+            manager.apply_batch(ops, line_numbers)
+
         elif args.command == "generate-hash":
             content_hash = manager.generate_content_hash(args.file)
             print(content_hash)
@@ -9,14 +9,43 @@ in the CI/CD recovery system, allowing manual intervention and monitoring.
 import argparse
 import json
 import os
+import random
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, Optional
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+except ImportError:
+    requests = None
+
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+# How long a bulk listing of repository variables is trusted, in seconds
+VARIABLE_CACHE_TTL = 30
+
+# Concurrent variable writes; kept small to stay clear of secondary rate limits
+SET_VARIABLE_WORKERS = 4
+
+# Write-and-verify rounds for the shared event log before giving up
+EVENT_LOG_ATTEMPTS = 3
+
+# ETags and bodies of variable listings, so repeat reads can be answered with 304s
+RESPONSE_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "tailpaste"
+    / "circuit_breaker.json"
+)
+
 
 class CircuitBreakerManager:
-    def __init__(self, repo: str):
+    def __init__(self, repo: str, use_cache: bool = True):
         self.repo = repo
         self.gh_token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
         if not self.gh_token:
@@ -28,6 +57,41 @@ class CircuitBreakerManager:
         # to represent a cleared value without deleting the variable.
         self.clear_placeholder = "unset"
 
+        self._api = self._create_api_session()
+        self._var_cache: Optional[Dict[str, str]] = None
+        self._var_cache_loaded_at = 0.0
+        self.use_cache = use_cache
+        self._response_cache: Optional[Dict[str, Dict]] = None
+
+    def _create_api_session(self):
+        """Create a keep-alive GitHub REST session, or None to use the gh CLI"""
+        if requests is None:
+            return None
+        session = requests.Session()
+        # Variable PATCHes are idempotent; POST creates are left to fail loudly
+        retry = Retry(
+            total=5,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "PATCH"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        session.mount("https://", HTTPAdapter(max_retries=retry))
+        session.headers.update(
+            {
+                "Authorization": f"Bearer {self.gh_token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            }
+        )
+        return session
+
+    def _variables_url(self, name: str = "") -> str:
+        """REST URL for the repository's actions variables, or one variable"""
+        url = f"{GITHUB_API_URL}/repos/{self.repo}/actions/variables"
+        return f"{url}/{name}" if name else url
+
     def _run_gh_command(self, command: list) -> tuple[bool, str]:
         """Run a GitHub CLI command and return success status and output"""
         try:
@@ -48,8 +112,122 @@ class CircuitBreakerManager:
         except Exception as e:
             return False, str(e)
 
+    def _load_response_cache(self) -> Dict[str, Dict]:
+        """Load cached listing pages keyed by URL"""
+        if self._response_cache is None:
+            self._response_cache = {}
+            if self.use_cache:
+                try:
+                    with open(RESPONSE_CACHE_PATH, "r") as f:
+                        self._response_cache = json.load(f)
+                except (OSError, ValueError):
+                    pass
+        return self._response_cache
+
+    def _save_response_cache(self) -> None:
+        """Persist cached listing pages; failures only cost a full refetch"""
+        if not self.use_cache or self._response_cache is None:
+            return
+        try:
+            RESPONSE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = RESPONSE_CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self._response_cache, f)
+            os.replace(tmp_path, RESPONSE_CACHE_PATH)
+        except OSError as e:
+            print(f"⚠️  Could not write response cache: {e}", file=sys.stderr)
+
+    def _check_rate_limit(self, response) -> None:
+        """Stop using the API once the primary rate limit is spent"""
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = int(response.headers.get("X-RateLimit-Reset", "0"))
+            reset_at = datetime.fromtimestamp(reset, timezone.utc).isoformat()
+            self._api = None
+            print(
+                f"⚠️  GitHub API rate limit exhausted until {reset_at}", file=sys.stderr
+            )
+
+    def _api_list_variables(self) -> Optional[list]:
+        """List repository variables over the REST session, or None on failure"""
+        cache = self._load_response_cache()
+        # The next-page links carry the query string, so URLs are stable cache keys
+        url: Optional[str] = f"{self._variables_url()}?per_page=100"
+        variables: list = []
+        try:
+            while url:
+                cached = cache.get(url)
+                headers = {"If-None-Match": cached["etag"]} if cached else {}
+                response = self._api.get(url, headers=headers, timeout=30)
+                self._check_rate_limit(response)
+                if cached and response.status_code == 304:
+                    page = cached
+                else:
+                    response.raise_for_status()
+                    page = {
+                        "etag": response.headers.get("ETag"),
+                        "variables": response.json().get("variables", []),
+                        "next": response.links.get("next", {}).get("url"),
+                    }
+                    if page["etag"]:
+                        cache[url] = page
+                variables.extend(page["variables"])
+                url = page["next"]
+        except Exception as e:
+            print(
+                f"⚠️  GitHub API variable listing failed, falling back to gh: {e}",
+                file=sys.stderr,
+            )
+            return None
+        self._save_response_cache()
+        return variables
+
+    def _load_all_variables(self) -> Optional[Dict[str, str]]:
+        """Fetch every repository variable in one listing, cached briefly"""
+        now = time.monotonic()
+        if (
+            self._var_cache is not None
+            and now - self._var_cache_loaded_at < VARIABLE_CACHE_TTL
+        ):
+            return self._var_cache
+
+        fetched = self._api_list_variables() if self._api is not None else None
+        if fetched is None:
+            success, output = self._run_gh_command(
+                ["variable", "list", "--repo", self.repo, "--json", "name,value"]
+            )
+            if not success:
+                return None
+            try:
+                fetched = json.loads(output)
+            except json.JSONDecodeError:
+                return None
+
+        self._var_cache = {var["name"]: var["value"] for var in fetched}
+        self._var_cache_loaded_at = now
+        return self._var_cache
+
     def get_variable(self, name: str) -> Optional[str]:
         """Get a GitHub repository variable"""
+        variables = self._load_all_variables()
+        if variables is not None:
+            return variables.get(name)
+        return self._fetch_variable(name)
+
+    def _fetch_variable(self, name: str) -> Optional[str]:
+        """Read one variable directly, bypassing the cached listing"""
+        if self._api is not None:
+            try:
+                response = self._api.get(self._variables_url(name), timeout=30)
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                return response.json()["value"]
+            except Exception as e:
+                print(
+                    f"⚠️  GitHub API read of {name} failed, falling back to gh: {e}",
+                    file=sys.stderr,
+                )
+
         success, output = self._run_gh_command(
             ["variable", "get", name, "--repo", self.repo]
         )
@@ -57,13 +235,59 @@ class CircuitBreakerManager:
 
     def set_variable(self, name: str, value: str) -> bool:
         """Set a GitHub repository variable"""
+        if self._cached_value(name) == value:
+            return True
+
+        if self._api is not None:
+            try:
+                body = {"name": name, "value": value}
+                response = self._api.patch(
+                    self._variables_url(name), json=body, timeout=30
+                )
+                if response.status_code == 404:
+                    # Variable does not exist yet
+                    response = self._api.post(
+                        self._variables_url(), json=body, timeout=30
+                    )
+                response.raise_for_status()
+                self._remember_variable(name, value)
+                return True
+            except Exception as e:
+                print(
+                    f"⚠️  GitHub API write of {name} failed, falling back to gh: {e}",
+                    file=sys.stderr,
+                )
+
         success, output = self._run_gh_command(
             ["variable", "set", name, "--body", value, "--repo", self.repo]
         )
-        if not success:
+        if success:
+            self._remember_variable(name, value)
+        else:
             print(f"❌ Failed to set variable {name}: {output}")
         return success
 
+    def _set_many(self, items: list) -> list:
+        """Set several independent variables concurrently, returning each result"""
+        # One listing lets set_variable skip values that are already current
+        self._load_all_variables()
+        with ThreadPoolExecutor(max_workers=SET_VARIABLE_WORKERS) as executor:
+            return list(executor.map(lambda item: self.set_variable(*item), items))
+
+    def _cached_value(self, name: str) -> Optional[str]:
+        """Value from a still-fresh listing, without fetching one"""
+        if (
+            self._var_cache is None
+            or time.monotonic() - self._var_cache_loaded_at >= VARIABLE_CACHE_TTL
+        ):
+            return None
+        return self._var_cache.get(name)
+
+    def _remember_variable(self, name: str, value: str) -> None:
+        """Keep the cached listing in step with a successful write"""
+        if self._var_cache is not None:
+            self._var_cache[name] = value
+
     def get_circuit_breaker_status(self) -> Dict[str, str]:
         """Get comprehensive circuit breaker status"""
         status = {
@@ -104,56 +328,66 @@ class CircuitBreakerManager:
         }
         return status
 
+    def _write_report(self, lines: list) -> None:
+        """Write a finished report to stdout in one call"""
+        sys.stdout.write("\n".join(lines) + "\n")
+
     def print_status(self) -> None:
         """Print current circuit breaker status"""
         status = self.get_circuit_breaker_status()
+        lines = []
 
-        print("=" * 60)
-        print("🔌 Circuit Breaker Status")
-        print("=" * 60)
+        lines.append("=" * 60)
+        lines.append("🔌 Circuit Breaker Status")
+        lines.append("=" * 60)
 
         # Status with emoji
         cb_status = status["status"]
         if cb_status == "open":
-            print(f"Status: 🚫 OPEN")
+            lines.append(f"Status: 🚫 OPEN")
         elif cb_status == "closed":
-            print(f"Status: ✅ CLOSED")
+            lines.append(f"Status: ✅ CLOSED")
         else:
-            print(f"Status: ❓ {cb_status.upper()}")
+            lines.append(f"Status: ❓ {cb_status.upper()}")
 
-        print(
+        lines.append(
             f"Recovery Failures: {status['recovery_failure_count']} / {status['recovery_threshold']}"
         )
-        print(
+        lines.append(
             f"Deployment Failures: {status['deployment_failure_count']} / {status['deployment_threshold']}"
         )
 
         if status["last_recovery_failure_time"]:
-            print(f"Last Recovery Failure: {status['last_recovery_failure_time']}")
+            lines.append(
+                f"Last Recovery Failure: {status['last_recovery_failure_time']}"
+            )
             if status["last_recovery_failure_reason"]:
-                print(f"  Reason: {status['last_recovery_failure_reason']}")
+                lines.append(f"  Reason: {status['last_recovery_failure_reason']}")
 
         if status["last_deployment_failure_time"]:
-            print(f"Last Deployment Failure: {status['last_deployment_failure_time']}")
+            lines.append(
+                f"Last Deployment Failure: {status['last_deployment_failure_time']}"
+            )
             if status["last_deployment_failure_reason"]:
-                print(f"  Reason: {status['last_deployment_failure_reason']}")
+                lines.append(f"  Reason: {status['last_deployment_failure_reason']}")
 
         if cb_status == "open":
             if status["opened_at"]:
-                print(f"Opened At: {status['opened_at']}")
+                lines.append(f"Opened At: {status['opened_at']}")
             if status["opened_by"]:
-                print(f"Opened By: {status['opened_by']}")
+                lines.append(f"Opened By: {status['opened_by']}")
             if status["trigger_reason"]:
-                print(f"Trigger Reason: {status['trigger_reason']}")
+                lines.append(f"Trigger Reason: {status['trigger_reason']}")
 
         if status["last_override"]:
-            print(f"Last Override: {status['last_override']}")
+            lines.append(f"Last Override: {status['last_override']}")
             if status["override_by"]:
-                print(f"  By: {status['override_by']}")
+                lines.append(f"  By: {status['override_by']}")
             if status["override_reason"]:
-                print(f"  Reason: {status['override_reason']}")
+                lines.append(f"  Reason: {status['override_reason']}")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+        self._write_report(lines)
 
     def open_circuit_breaker(self, reason: str = "manual") -> bool:
         """Manually open the circuit breaker"""
@@ -162,13 +396,15 @@ class CircuitBreakerManager:
         timestamp = datetime.now(timezone.utc).isoformat()
 
         success = all(
-            [
-                self.set_variable("CIRCUIT_BREAKER_STATUS", "open"),
-                self.set_variable("CIRCUIT_BREAKER_OPENED_AT", timestamp),
-                self.set_variable("CIRCUIT_BREAKER_OPENED_BY", "manual"),
-                self.set_variable("CIRCUIT_BREAKER_TRIGGER_REASON", reason),
-                self.set_variable("LAST_CIRCUIT_BREAKER_TRIGGER", timestamp),
-            ]
+            self._set_many(
+                [
+                    ("CIRCUIT_BREAKER_STATUS", "open"),
+                    ("CIRCUIT_BREAKER_OPENED_AT", timestamp),
+                    ("CIRCUIT_BREAKER_OPENED_BY", "manual"),
+                    ("CIRCUIT_BREAKER_TRIGGER_REASON", reason),
+                    ("LAST_CIRCUIT_BREAKER_TRIGGER", timestamp),
+                ]
+            )
         )
 
         if success:
@@ -207,15 +443,21 @@ class CircuitBreakerManager:
 
         success = True
 
-        # Set variables
-        for name, value in variables_to_set:
-            if not self.set_variable(name, value):
+        # Clear variables using a placeholder value to satisfy API requirements
+        results = self._set_many(
+            variables_to_set
+            + [(name, self.clear_placeholder) for name in variables_to_clear]
+        )
+        set_count = len(variables_to_set)
+        clear_results = results[set_count:]
+
+        for (name, _), ok in zip(variables_to_set, results):
+            if not ok:
                 success = False
                 print(f"❌ Failed to set {name}")
 
-        # Clear variables using a placeholder value to satisfy API requirements
-        for name in variables_to_clear:
-            if not self.set_variable(name, self.clear_placeholder):
+        for name, ok in zip(variables_to_clear, clear_results):
+            if not ok:
                 print(f"⚠️  Warning: Failed to clear {name}")
 
         if success:
@@ -271,37 +513,41 @@ class CircuitBreakerManager:
     def print_recovery_history(self) -> None:
         """Print recent recovery history"""
         history = self.get_recovery_history()
+        lines = []
 
-        print("=" * 60)
-        print("📋 Recent Recovery History")
-        print("=" * 60)
+        lines.append("=" * 60)
+        lines.append("📋 Recent Recovery History")
+        lines.append("=" * 60)
 
         if history["last_recovery_trigger"]:
-            print(f"Last Recovery Trigger: {history['last_recovery_trigger']}")
+            lines.append(f"Last Recovery Trigger: {history['last_recovery_trigger']}")
             if history["last_recovery_reason"]:
-                print(f"  Reason: {history['last_recovery_reason']}")
+                lines.append(f"  Reason: {history['last_recovery_reason']}")
 
         if history["last_completed_recovery"]:
-            print(f"Last Completed Recovery: {history['last_completed_recovery']}")
+            lines.append(
+                f"Last Completed Recovery: {history['last_completed_recovery']}"
+            )
             if history["last_recovery_session"]:
-                print(f"  Session: {history['last_recovery_session']}")
+                lines.append(f"  Session: {history['last_recovery_session']}")
             if history["recovery_successful"]:
                 success_status = (
                     "✅ Success"
                     if history["recovery_successful"] == "true"
                     else "❌ Failed"
                 )
-                print(f"  Result: {success_status}")
+                lines.append(f"  Result: {success_status}")
 
         if history["last_redeployment_trigger"]:
-            print(f"Last Redeployment: {history['last_redeployment_trigger']}")
+            lines.append(f"Last Redeployment: {history['last_redeployment_trigger']}")
             if history["last_redeployment_artifact"]:
-                print(f"  Artifact: {history['last_redeployment_artifact']}")
+                lines.append(f"  Artifact: {history['last_redeployment_artifact']}")
 
         if not any(history.values()):
-            print("No recent recovery history found")
+            lines.append("No recent recovery history found")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+        self._write_report(lines)
 
     def _log_circuit_breaker_event(
         self, action: str, reason: str, triggered_by: str
@@ -318,43 +564,48 @@ class CircuitBreakerManager:
         }
 
         # Get existing event log
-        event_log = self.get_variable("CIRCUIT_BREAKER_EVENT_LOG") or "[]"
-
+        event_log = self.get_variable("CIRCUIT_BREAKER_EVENT_LOG")
+
+        # The variables API has no compare-and-swap, so re-read after writing
+        # and merge again if a concurrent runner replaced the log
+        for attempt in range(EVENT_LOG_ATTEMPTS):
+            events = self._parse_event_log(event_log)
+            if event_data not in events:
+                # Add new event, keeping only the last 20
+                events = (events + [event_data])[-20:]
+                self.set_variable("CIRCUIT_BREAKER_EVENT_LOG", json.dumps(events))
+
+            event_log = self._fetch_variable("CIRCUIT_BREAKER_EVENT_LOG")
+            if event_data in self._parse_event_log(event_log):
+                print(f"📝 Circuit breaker event logged: {action} - {reason}")
+                return
+            if attempt < EVENT_LOG_ATTEMPTS - 1:
+                time.sleep(random.uniform(0, 0.5 * 2**attempt))
+
+        print(f"⚠️  Warning: Could not confirm event was logged: {action} - {reason}")
+
+    def _parse_event_log(self, event_log: Optional[str]) -> list:
+        """Decode the stored event log, treating damage as an empty log"""
         try:
-            events = json.loads(event_log)
+            return json.loads(event_log or "[]")
         except json.JSONDecodeError:
-            events = []
-
-        # Add new event
-        events.append(event_data)
-
-        # Keep only last 20 events
-        events = events[-20:]
-
-        # Store updated log
-        self.set_variable("CIRCUIT_BREAKER_EVENT_LOG", json.dumps(events))
-
-        print(f"📝 Circuit breaker event logged: {action} - {reason}")
+            return []
 
     def get_event_log(self) -> list:
         """Get circuit breaker event log"""
-        event_log = self.get_variable("CIRCUIT_BREAKER_EVENT_LOG") or "[]"
-
-        try:
-            return json.loads(event_log)
-        except json.JSONDecodeError:
-            return []
+        return self._parse_event_log(self.get_variable("CIRCUIT_BREAKER_EVENT_LOG"))
 
     def print_event_log(self) -> None:
         """Print circuit breaker event log"""
         events = self.get_event_log()
+        lines = []
 
-        print("=" * 60)
-        print("📋 Circuit Breaker Event Log")
-        print("=" * 60)
+        lines.append("=" * 60)
+        lines.append("📋 Circuit Breaker Event Log")
+        lines.append("=" * 60)
 
         if not events:
-            print("No events recorded")
+            lines.append("No events recorded")
         else:
             for event in events[-10:]:  # Show last 10 events
                 timestamp = event.get("timestamp", "unknown")
@@ -365,13 +616,14 @@ class CircuitBreakerManager:
                 action_emoji = (
                     "🚫" if action == "opened" else "✅" if action == "closed" else "🔄"
                 )
-                print(f"{action_emoji} {timestamp}")
-                print(f"   Action: {action.upper()}")
-                print(f"   Reason: {reason}")
-                print(f"   Triggered By: {triggered_by}")
-                print()
+                lines.append(f"{action_emoji} {timestamp}")
+                lines.append(f"   Action: {action.upper()}")
+                lines.append(f"   Reason: {reason}")
+                lines.append(f"   Triggered By: {triggered_by}")
+                lines.append("")
 
-        print("=" * 60)
+        lines.append("=" * 60)
+        self._write_report(lines)
 
     def check_thresholds(self) -> Dict[str, bool]:
         """Check if any thresholds are exceeded"""
@@ -461,6 +713,11 @@ def main():
     parser.add_argument(
         "--repo", required=True, help="GitHub repository in format owner/repo"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached API responses and refetch all variables",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -510,7 +767,7 @@ def main():
         return 1
 
     try:
-        manager = CircuitBreakerManager(args.repo)
+        manager = CircuitBreakerManager(args.repo, use_cache=not args.no_cache)
 
         if args.command == "status":
             if args.json:
@@ -16,9 +16,85 @@ import json
 import os
 import subprocess
 import sys
-from datetime import datetime, timedelta
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Bypass flags that require a detailed reason, in report order
+SENSITIVE_OPERATIONS = (
+    "bypass_gating",
+    "override_circuit_breaker",
+    "force_deployment",
+    "emergency_rollback",
+)
+
+# Action status -> emoji shown in reports and listings
+STATUS_EMOJI = {
+    "successful": "✅",
+    "completed": "✅",
+    "failed": "❌",
+    "initiated": "🔄",
+    "pending": "⏳",
+}
+
+# Stored timestamp format (UTC, always with microseconds)
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def json_loads(raw):
+    """Parse JSON text or bytes, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps_sorted(obj: Any) -> bytes:
+    """Serialize to indented, key-sorted UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def timestamp_epoch(timestamp: str) -> Optional[float]:
+    """Seconds since the epoch for a stored ...Z timestamp, or None if unparseable"""
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def action_epoch(action: Dict) -> Optional[float]:
+    """Seconds since the epoch at which an action was recorded, if known"""
+    epoch = action.get("ts_epoch")
+    if epoch is None:
+        # Records written before ts_epoch existed
+        epoch = timestamp_epoch(action.get("timestamp", ""))
+    return epoch
+
+
+def utc_now_iso(now: Optional[datetime] = None) -> str:
+    """Format `now` (default: the current time) as a stored UTC timestamp"""
+    return (now or datetime.now(timezone.utc)).strftime(TIMESTAMP_FORMAT)
+
+
+def cutoff_epoch(days: int) -> float:
+    """Seconds since the epoch for the start of the last `days` days"""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
 
 
 class ManualActionManager:
@@ -26,32 +102,102 @@ class ManualActionManager:
 
     def __init__(self):
         self.manual_actions_file = Path(".manual_actions_history.json")
+        # Parsed history file and the (mtime_ns, size, inode) it was read at
+        self._cache = None
+        self._cache_key = None
+        # Action ID lookup table for the document in _indexed (see _find_action)
+        self._indexed = None
+        self._by_id = {}
+        # repository -> validate_repository_access result for this process
+        self._repo_access = {}
+
+    def _file_key(self) -> Optional[Tuple[int, int, int]]:
+        """Return the (mtime_ns, size, inode) of the history file, or None if missing.
+
+        The inode changes on every atomic save (os.replace of a new file), so
+        a rewrite with the same size inside one mtime tick is still noticed.
+        """
+        try:
+            stat = self.manual_actions_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
     def load_manual_actions_history(self) -> Dict:
-        """Load manual actions history from file."""
-        if self.manual_actions_file.exists():
+        """Load manual actions history from file.
+
+        The parsed document is reused until the file's mtime, size or inode changes,
+        so repeated operations in one process cost a stat() instead of a
+        full re-parse.
+        """
+        key = self._file_key()
+        if key is not None:
+            if self._cache is not None and key == self._cache_key:
+                return self._cache
             try:
-                with open(self.manual_actions_file, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                data = json_loads(self.manual_actions_file.read_bytes())
+            except (ValueError, IOError) as e:
                 print(
                     f"Warning: Could not load manual actions history file: {e}",
                     file=sys.stderr,
                 )
+            else:
+                self._cache = data
+                self._cache_key = key
+                return data
         return {"manual_actions": [], "metadata": {"version": "1.0"}}
 
+    @contextmanager
+    def _history_lock(self) -> Iterator[None]:
+        """Serialize load-modify-save cycles across processes.
+
+        Holds an exclusive flock on a sidecar lock file. Where fcntl is not
+        available the block runs unlocked, as it did before.
+        """
+        if fcntl is None:
+            yield
+            return
+        lock_file = self.manual_actions_file.with_name(
+            self.manual_actions_file.name + ".lock"
+        )
+        with open(lock_file, "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
     def save_manual_actions_history(self, data: Dict) -> None:
-        """Save manual actions history to file."""
+        """Save manual actions history to file.
+
+        The document is written to a temporary file next to the history file
+        and moved into place, so an interrupted save never leaves a truncated
+        file behind.
+        """
+        tmp_file = self.manual_actions_file.with_name(
+            self.manual_actions_file.name + ".tmp"
+        )
         try:
-            with open(self.manual_actions_file, "w") as f:
-                json.dump(data, f, indent=2, sort_keys=True)
+            with open(tmp_file, "wb") as f:
+                f.write(json_dumps_sorted(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.manual_actions_file)
         except IOError as e:
             print(
                 f"Error: Could not save manual actions history file: {e}",
                 file=sys.stderr,
             )
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             sys.exit(1)
 
+        self._cache = data
+        self._cache_key = self._file_key()
+        self._indexed = None
+
     def validate_manual_action_parameters(
         self,
         action_type: str,
@@ -71,15 +217,8 @@ class ManualActionManager:
 
         # Check for sensitive operations requiring detailed reasons
         bypass_flags = bypass_flags or {}
-        sensitive_operations = [
-            "bypass_gating",
-            "override_circuit_breaker",
-            "force_deployment",
-            "emergency_rollback",
-        ]
-
         has_sensitive_bypass = any(
-            bypass_flags.get(flag, False) for flag in sensitive_operations
+            bypass_flags.get(flag, False) for flag in SENSITIVE_OPERATIONS
         )
 
         if has_sensitive_bypass and len(reason.strip()) < 20:
@@ -102,124 +241,126 @@ class ManualActionManager:
         additional_data: Dict = None,
     ) -> str:
         """Record a manual action in history."""
-        data = self.load_manual_actions_history()
+        with self._history_lock():
+            data = self.load_manual_actions_history()
+            now = datetime.now(timezone.utc)
+            now_iso = utc_now_iso(now)
+
+            action_id = f"manual-{action_type}-{now.strftime('%Y%m%d-%H%M%S')}"
+
+            manual_action_record = {
+                "id": action_id,
+                "action_type": action_type,
+                "actor": actor,
+                "reason": reason,
+                "repository": repository,
+                "timestamp": now_iso,
+                "ts_epoch": int(now.timestamp()),
+                "workflow_run_id": workflow_run_id,
+                "artifact_digest": artifact_digest,
+                "bypass_flags": bypass_flags or {},
+                "additional_data": additional_data or {},
+                "status": "initiated",
+            }
 
-        action_id = (
-            f"manual-{action_type}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
-        )
+            data["manual_actions"].append(manual_action_record)
+            data["metadata"]["last_updated"] = now_iso
 
-        manual_action_record = {
-            "id": action_id,
-            "action_type": action_type,
-            "actor": actor,
-            "reason": reason,
-            "repository": repository,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "workflow_run_id": workflow_run_id,
-            "artifact_digest": artifact_digest,
-            "bypass_flags": bypass_flags or {},
-            "additional_data": additional_data or {},
-            "status": "initiated",
-        }
-
-        data["manual_actions"].append(manual_action_record)
-        data["metadata"]["last_updated"] = datetime.utcnow().isoformat() + "Z"
-
-        self.save_manual_actions_history(data)
-        print(f"Recorded manual action: {action_id}")
-        return action_id
+            self.save_manual_actions_history(data)
+            print(f"Recorded manual action: {action_id}")
+            return action_id
 
     def update_manual_action_status(
         self, action_id: str, status: str, outcome: str = None, details: str = None
     ) -> None:
         """Update the status of a manual action."""
-        data = self.load_manual_actions_history()
+        with self._history_lock():
+            data = self.load_manual_actions_history()
+            now_iso = utc_now_iso()
 
-        # Find manual action record
-        action_found = False
-        for action in data["manual_actions"]:
-            if action["id"] == action_id:
-                action["status"] = status
-                action["updated_at"] = datetime.utcnow().isoformat() + "Z"
+            # Find manual action record
+            action = self._find_action(data, action_id)
+            if action is None:
+                print(f"Warning: Manual action {action_id} not found", file=sys.stderr)
+                return
 
-                if outcome:
-                    action["outcome"] = outcome
+            action["status"] = status
+            action["updated_at"] = now_iso
 
-                if details:
-                    action["details"] = details
+            if outcome:
+                action["outcome"] = outcome
 
-                if status in ["completed", "successful"]:
-                    action["completed_at"] = datetime.utcnow().isoformat() + "Z"
-                elif status == "failed":
-                    action["failed_at"] = datetime.utcnow().isoformat() + "Z"
+            if details:
+                action["details"] = details
 
-                action_found = True
-                print(f"Updated manual action {action_id} status to: {status}")
-                break
+            if status in ["completed", "successful"]:
+                action["completed_at"] = now_iso
+            elif status == "failed":
+                action["failed_at"] = now_iso
 
-        if not action_found:
-            print(f"Warning: Manual action {action_id} not found", file=sys.stderr)
-            return
+            print(f"Updated manual action {action_id} status to: {status}")
 
-        data["metadata"]["last_updated"] = datetime.utcnow().isoformat() + "Z"
-        self.save_manual_actions_history(data)
+            data["metadata"]["last_updated"] = now_iso
+            self.save_manual_actions_history(data)
 
     def get_manual_action_status(self, action_id: str) -> Optional[Dict]:
         """Get the status of a specific manual action."""
-        data = self.load_manual_actions_history()
-
-        for action in data["manual_actions"]:
-            if action["id"] == action_id:
-                return action
-
-        return None
+        return self._find_action(self.load_manual_actions_history(), action_id)
+
+    def _find_action(self, data: Dict, action_id: str) -> Optional[Dict]:
+        """Return the first action with this ID in a loaded document, or None.
+
+        The ID table is built once per loaded document and rebuilt after a
+        save, since saves may follow appends to the cached document.
+        """
+        if self._indexed is not data:
+            by_id = {}
+            for action in data["manual_actions"]:
+                by_id.setdefault(action["id"], action)
+            self._by_id = by_id
+            self._indexed = data
+        return self._by_id.get(action_id)
+
+    def _iter_actions(
+        self,
+        repository: str = None,
+        action_type: str = None,
+        since_epoch: float = None,
+    ) -> Iterator[Dict]:
+        """Yield recorded actions matching every given filter, in file order."""
+        for action in self.load_manual_actions_history()["manual_actions"]:
+            if since_epoch is not None:
+                # Actions with an unreadable timestamp can't be placed in a window
+                epoch = action_epoch(action)
+                if epoch is None or epoch <= since_epoch:
+                    continue
+            if repository and action.get("repository") != repository:
+                continue
+            if action_type and action.get("action_type") != action_type:
+                continue
+            yield action
 
     def get_recent_manual_actions(
         self, repository: str = None, action_type: str = None, limit: int = 20
     ) -> List[Dict]:
         """Get recent manual actions with optional filtering."""
-        data = self.load_manual_actions_history()
-
-        # Filter by repository and action type if specified
-        filtered_actions = data["manual_actions"]
-
-        if repository:
-            filtered_actions = [
-                action
-                for action in filtered_actions
-                if action.get("repository") == repository
-            ]
-
-        if action_type:
-            filtered_actions = [
-                action
-                for action in filtered_actions
-                if action.get("action_type") == action_type
-            ]
+        filtered_actions = self._iter_actions(repository, action_type)
 
         # Sort by timestamp (most recent first)
-        filtered_actions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-
-        return filtered_actions[:limit]
+        return sorted(
+            filtered_actions, key=lambda x: x.get("timestamp", ""), reverse=True
+        )[:limit]
 
     def generate_manual_actions_report(
         self, repository: str = None, days: int = 30
     ) -> str:
         """Generate a comprehensive manual actions report."""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-        # Get recent actions within the specified timeframe
-        all_actions = self.get_recent_manual_actions(repository=repository, limit=1000)
-
-        # Filter by date
-        recent_actions = [
-            action
-            for action in all_actions
-            if datetime.fromisoformat(
-                action.get("timestamp", "").replace("Z", "+00:00")
-            )
-            > cutoff_date
-        ]
+        # Get actions within the specified timeframe, most recent first
+        recent_actions = sorted(
+            self._iter_actions(repository=repository, since_epoch=cutoff_epoch(days)),
+            key=lambda x: x.get("timestamp", ""),
+            reverse=True,
+        )
 
         if not recent_actions:
             return f"No manual actions found for repository: {repository or 'all repositories'} in the last {days} days"
@@ -228,40 +369,32 @@ class ManualActionManager:
             f"# Manual Actions Report",
             f"Repository: {repository or 'All repositories'}",
             f"Time Period: Last {days} days",
-            f"Generated at: {datetime.utcnow().isoformat()}Z",
+            f"Generated at: {utc_now_iso()}",
             "",
             f"Total manual actions: {len(recent_actions)}",
             "",
         ]
 
         # Summary statistics
-        action_types = {}
-        actors = {}
-        bypass_usage = {
-            "bypass_gating": 0,
-            "override_circuit_breaker": 0,
-            "force_deployment": 0,
-            "emergency_rollback": 0,
-        }
+        action_types = Counter()
+        actors = Counter()
+        bypass_usage = dict.fromkeys(SENSITIVE_OPERATIONS, 0)
 
         successful_count = 0
         failed_count = 0
         pending_count = 0
 
         for action in recent_actions:
-            # Count action types
-            action_type = action.get("action_type", "unknown")
-            action_types[action_type] = action_types.get(action_type, 0) + 1
-
-            # Count actors
-            actor = action.get("actor", "unknown")
-            actors[actor] = actors.get(actor, 0) + 1
+            # Count action types and actors
+            action_types[action.get("action_type", "unknown")] += 1
+            actors[action.get("actor", "unknown")] += 1
 
             # Count bypass flag usage
-            bypass_flags = action.get("bypass_flags", {})
-            for flag, count in bypass_usage.items():
-                if bypass_flags.get(flag, False):
-                    bypass_usage[flag] += 1
+            bypass_flags = action.get("bypass_flags")
+            if bypass_flags:
+                for flag in bypass_usage:
+                    if bypass_flags.get(flag, False):
+                        bypass_usage[flag] += 1
 
             # Count status
             status = action.get("status", "unknown")
@@ -293,9 +426,7 @@ class ManualActionManager:
             ]
         )
 
-        for actor, count in sorted(actors.items(), key=lambda x: x[1], reverse=True)[
-            :10
-        ]:
+        for actor, count in actors.most_common(10):
             report_lines.append(f"- {actor}: {count}")
 
         report_lines.extend(
@@ -313,13 +444,7 @@ class ManualActionManager:
         report_lines.extend(["", "## Recent Manual Actions", ""])
 
         for action in recent_actions[:20]:  # Show last 20
-            status_emoji = {
-                "successful": "✅",
-                "completed": "✅",
-                "failed": "❌",
-                "initiated": "🔄",
-                "pending": "⏳",
-            }.get(action.get("status", "unknown"), "❓")
+            status_emoji = STATUS_EMOJI.get(action.get("status", "unknown"), "❓")
 
             report_lines.extend(
                 [
@@ -356,6 +481,9 @@ class ManualActionManager:
 
     def validate_repository_access(self, repository: str) -> Tuple[bool, str]:
         """Validate that the user has access to the repository."""
+        if repository in self._repo_access:
+            return self._repo_access[repository]
+
         try:
             result = subprocess.run(
                 ["gh", "repo", "view", repository],
@@ -365,9 +493,12 @@ class ManualActionManager:
             )
 
             if result.returncode == 0:
-                return True, f"Repository access validated: {repository}"
+                outcome = True, f"Repository access validated: {repository}"
             else:
-                return False, f"Cannot access repository: {repository}"
+                outcome = False, f"Cannot access repository: {repository}"
+            # Timeouts and errors below are not cached so a retry can succeed
+            self._repo_access[repository] = outcome
+            return outcome
 
         except subprocess.TimeoutExpired:
             return False, "Timeout while validating repository access"
@@ -376,30 +507,30 @@ class ManualActionManager:
 
     def cleanup_old_manual_actions(self, days_to_keep: int = 180) -> int:
         """Clean up old manual action records to prevent file bloat."""
-        data = self.load_manual_actions_history()
-        cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+        with self._history_lock():
+            data = self.load_manual_actions_history()
+            cutoff = cutoff_epoch(days_to_keep)
 
-        original_count = len(data["manual_actions"])
+            original_count = len(data["manual_actions"])
 
-        # Keep manual actions newer than cutoff date
-        data["manual_actions"] = [
-            action
-            for action in data["manual_actions"]
-            if datetime.fromisoformat(
-                action.get("timestamp", "").replace("Z", "+00:00")
-            )
-            > cutoff_date
-        ]
+            # Keep manual actions newer than cutoff date, and any whose
+            # timestamp can't be read rather than discarding audit records
+            data["manual_actions"] = [
+                action
+                for action in data["manual_actions"]
+                if (epoch := action_epoch(action)) is None or epoch > cutoff
+            ]
 
-        removed_count = original_count - len(data["manual_actions"])
+            removed_count = original_count - len(data["manual_actions"])
 
-        if removed_count > 0:
-            data["metadata"]["last_cleanup"] = datetime.utcnow().isoformat() + "Z"
-            data["metadata"]["last_updated"] = datetime.utcnow().isoformat() + "Z"
-            self.save_manual_actions_history(data)
-            print(f"Cleaned up {removed_count} old manual action records")
+            if removed_count > 0:
+                now_iso = utc_now_iso()
+                data["metadata"]["last_cleanup"] = now_iso
+                data["metadata"]["last_updated"] = now_iso
+                self.save_manual_actions_history(data)
+                print(f"Cleaned up {removed_count} old manual action records")
 
-        return removed_count
+            return removed_count
 
 
 def main():
@@ -573,26 +704,25 @@ def main():
                 args.repository, args.action_type, args.limit
             )
             if actions:
+                lines = []
                 for action in actions:
-                    status_emoji = {
-                        "successful": "✅",
-                        "completed": "✅",
-                        "failed": "❌",
-                        "initiated": "🔄",
-                        "pending": "⏳",
-                    }.get(action.get("status", "unknown"), "❓")
-
-                    bypass_flags = action.get("bypass_flags", {})
-                    active_bypasses = [
-                        flag for flag, value in bypass_flags.items() if value
-                    ]
-                    bypass_info = (
-                        f" [{', '.join(active_bypasses)}]" if active_bypasses else ""
+                    status_emoji = STATUS_EMOJI.get(
+                        action.get("status", "unknown"), "❓"
                     )
 
-                    print(
+                    bypass_info = ""
+                    bypass_flags = action.get("bypass_flags")
+                    if bypass_flags:
+                        active_bypasses = [
+                            flag for flag, value in bypass_flags.items() if value
+                        ]
+                        if active_bypasses:
+                            bypass_info = f" [{', '.join(active_bypasses)}]"
+
+                    lines.append(
                         f"{status_emoji} {action['id']} - {action.get('action_type', 'unknown')} - {action.get('actor', 'unknown')} - {action.get('timestamp', 'N/A')}{bypass_info}"
                     )
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print(f"No manual actions found")
 
@@ -14,66 +14,115 @@ Requirements: 10.1, 10.2, 10.4, 10.5
 import argparse
 import json
 import os
+import re
 import subprocess
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Timestamp format for stored records, e.g. 2024-01-31T12:00:00.000000Z
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Docker digest format: sha256:64-character-hex-string
+DIGEST_PATTERN = re.compile(r"^sha256:[a-f0-9]{64}$")
+
 
 class RollbackManager:
     """Manages rollback operations and state tracking."""
 
     def __init__(self):
         self.rollback_history_file = Path(".rollback_history.json")
+        # Parsed history file and the (mtime_ns, size, inode) it was read at
+        self._cache = None
+        self._cache_key = None
+        # Rollback ID lookup table for the document in _indexed (see _find_rollback)
+        self._indexed = None
+        self._by_id = {}
+
+    def _file_key(self) -> Optional[Tuple[int, int, int]]:
+        """Return the (mtime_ns, size, inode) of the history file, or None if missing."""
+        try:
+            stat = self.rollback_history_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
     def load_rollback_history(self) -> Dict:
-        """Load rollback history from file."""
-        if self.rollback_history_file.exists():
+        """Load rollback history from file.
+
+        The parsed document is reused until the file's mtime, size or inode
+        changes (the inode catches an atomic replace by another process), so a
+        rollback that records several stage updates in one process parses the
+        file once.
+        """
+        key = self._file_key()
+        if key is not None:
+            if self._cache is not None and key == self._cache_key:
+                return self._cache
             try:
                 with open(self.rollback_history_file, "r") as f:
-                    return json.load(f)
+                    data = json.load(f)
             except (json.JSONDecodeError, IOError) as e:
                 print(
                     f"Warning: Could not load rollback history file: {e}",
                     file=sys.stderr,
                 )
+            else:
+                self._cache = data
+                self._cache_key = key
+                return data
         return {"rollbacks": [], "metadata": {"version": "1.0"}}
 
     def save_rollback_history(self, data: Dict) -> None:
-        """Save rollback history to file."""
+        """Save rollback history to file.
+
+        The document is written to a temporary file next to the history file
+        and moved into place, so an interrupted save never leaves a truncated
+        file behind.
+        """
+        tmp_file = self.rollback_history_file.with_name(
+            self.rollback_history_file.name + ".tmp"
+        )
         try:
-            with open(self.rollback_history_file, "w") as f:
+            with open(tmp_file, "w") as f:
                 json.dump(data, f, indent=2, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.rollback_history_file)
         except IOError as e:
             print(f"Error: Could not save rollback history file: {e}", file=sys.stderr)
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             sys.exit(1)
 
+        self._cache = data
+        self._cache_key = self._file_key()
+        self._indexed = None
+
     def validate_rollback_prerequisites(self, repository: str) -> Tuple[bool, str]:
         """Validate that rollback prerequisites are met."""
         try:
-            # Check if backup artifact digest is available
-            result = subprocess.run(
+            variables = self._get_variables(
+                repository,
                 [
-                    "gh",
-                    "variable",
-                    "get",
                     "BACKUP_ARTIFACT_DIGEST",
-                    "--repo",
-                    repository,
+                    "BACKUP_CREATED_AT",
+                    "DEPLOYED_ARTIFACT_DIGEST",
                 ],
-                capture_output=True,
-                text=True,
-                timeout=30,
             )
 
-            if result.returncode != 0:
+            # Check if backup artifact digest is available
+            backup_digest = variables["BACKUP_ARTIFACT_DIGEST"]
+            if backup_digest is None:
                 return (
                     False,
                     "No backup artifact digest found - cannot perform digest-based rollback",
                 )
 
-            backup_digest = result.stdout.strip()
             if not backup_digest:
                 return False, "Backup artifact digest is empty"
 
@@ -82,31 +131,10 @@ class RollbackManager:
                 return False, f"Invalid backup digest format: {backup_digest}"
 
             # Check if backup timestamp is available
-            result = subprocess.run(
-                ["gh", "variable", "get", "BACKUP_CREATED_AT", "--repo", repository],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            backup_timestamp = result.stdout.strip() if result.returncode == 0 else ""
+            backup_timestamp = variables["BACKUP_CREATED_AT"] or ""
 
             # Check current deployment state
-            result = subprocess.run(
-                [
-                    "gh",
-                    "variable",
-                    "get",
-                    "DEPLOYED_ARTIFACT_DIGEST",
-                    "--repo",
-                    repository,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            current_digest = result.stdout.strip() if result.returncode == 0 else ""
+            current_digest = variables["DEPLOYED_ARTIFACT_DIGEST"] or ""
 
             if current_digest == backup_digest:
                 return (
@@ -124,15 +152,49 @@ class RollbackManager:
         except subprocess.SubprocessError as e:
             return False, f"Error checking rollback prerequisites: {e}"
 
+    def _get_variables(
+        self, repository: str, names: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """Fetch repository variables, mapping each missing one to None.
+
+        All variables are listed with a single gh call; if that fails, each
+        name is fetched with its own concurrent `gh variable get`.
+        """
+        result = subprocess.run(
+            ["gh", "variable", "list", "--repo", repository, "--json", "name,value"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode == 0:
+            try:
+                listed = {
+                    var["name"]: var["value"].strip()
+                    for var in json.loads(result.stdout)
+                }
+            except (ValueError, KeyError, TypeError):
+                pass
+            else:
+                return {name: listed.get(name) for name in names}
+
+        def get_variable(name: str) -> Optional[str]:
+            result = subprocess.run(
+                ["gh", "variable", "get", name, "--repo", repository],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            return result.stdout.strip() if result.returncode == 0 else None
+
+        # The per-variable fallbacks are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            return dict(zip(names, executor.map(get_variable, names)))
+
     def _validate_digest_format(self, digest: str) -> bool:
         """Validate that a digest follows the expected SHA256 format."""
-        import re
-
         if not digest:
             return False
-        # Docker digest format: sha256:64-character-hex-string
-        pattern = r"^sha256:[a-f0-9]{64}$"
-        return bool(re.match(pattern, digest))
+        return DIGEST_PATTERN.match(digest) is not None
 
     def record_rollback_attempt(
         self,
@@ -145,7 +207,10 @@ class RollbackManager:
         """Record a rollback attempt in history."""
         data = self.load_rollback_history()
 
-        rollback_id = f"rollback-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+        now = datetime.now(timezone.utc)
+        now_iso = now.strftime(TIMESTAMP_FORMAT)
+
+        rollback_id = f"rollback-{now.strftime('%Y%m%d-%H%M%S')}"
 
         rollback_record = {
             "id": rollback_id,
@@ -153,7 +218,7 @@ class RollbackManager:
             "target_digest": target_digest,
             "method": method,
             "initiated_by": initiated_by,
-            "initiated_at": datetime.utcnow().isoformat() + "Z",
+            "initiated_at": now_iso,
             "reason": reason,
             "status": "initiated",
             "stages": {
@@ -165,7 +230,7 @@ class RollbackManager:
         }
 
         data["rollbacks"].append(rollback_record)
-        data["metadata"]["last_updated"] = datetime.utcnow().isoformat() + "Z"
+        data["metadata"]["last_updated"] = now_iso
 
         self.save_rollback_history(data)
         print(f"Recorded rollback attempt: {rollback_id}")
@@ -176,53 +241,58 @@ class RollbackManager:
     ) -> None:
         """Update the status of a rollback stage."""
         data = self.load_rollback_history()
+        now_iso = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
 
         # Find rollback record
-        rollback_found = False
-        for rollback in data["rollbacks"]:
-            if rollback["id"] == rollback_id:
-                if stage in rollback["stages"]:
-                    rollback["stages"][stage] = {
-                        "status": status,
-                        "timestamp": datetime.utcnow().isoformat() + "Z",
-                        "details": details,
-                    }
-
-                    # Update overall rollback status based on stage
-                    if status == "failed":
-                        rollback["status"] = "failed"
-                        rollback["failure_stage"] = stage
-                        rollback["failure_reason"] = details
-                    elif status == "completed" and stage == "health_check":
-                        rollback["status"] = "successful"
-                        rollback["completed_at"] = datetime.utcnow().isoformat() + "Z"
-
-                    rollback_found = True
-                    print(f"Updated rollback {rollback_id} stage {stage} to: {status}")
-                    break
-                else:
-                    print(
-                        f"Warning: Unknown stage {stage} for rollback {rollback_id}",
-                        file=sys.stderr,
-                    )
-                    return
-
-        if not rollback_found:
+        rollback = self._find_rollback(data, rollback_id)
+        if rollback is None:
             print(f"Warning: Rollback {rollback_id} not found", file=sys.stderr)
             return
 
-        data["metadata"]["last_updated"] = datetime.utcnow().isoformat() + "Z"
+        if stage not in rollback["stages"]:
+            print(
+                f"Warning: Unknown stage {stage} for rollback {rollback_id}",
+                file=sys.stderr,
+            )
+            return
+
+        rollback["stages"][stage] = {
+            "status": status,
+            "timestamp": now_iso,
+            "details": details,
+        }
+
+        # Update overall rollback status based on stage
+        if status == "failed":
+            rollback["status"] = "failed"
+            rollback["failure_stage"] = stage
+            rollback["failure_reason"] = details
+        elif status == "completed" and stage == "health_check":
+            rollback["status"] = "successful"
+            rollback["completed_at"] = now_iso
+
+        print(f"Updated rollback {rollback_id} stage {stage} to: {status}")
+
+        data["metadata"]["last_updated"] = now_iso
         self.save_rollback_history(data)
 
     def get_rollback_status(self, rollback_id: str) -> Optional[Dict]:
         """Get the status of a specific rollback."""
-        data = self.load_rollback_history()
-
-        for rollback in data["rollbacks"]:
-            if rollback["id"] == rollback_id:
-                return rollback
-
-        return None
+        return self._find_rollback(self.load_rollback_history(), rollback_id)
+
+    def _find_rollback(self, data: Dict, rollback_id: str) -> Optional[Dict]:
+        """Return the first rollback with this ID in a loaded document, or None.
+
+        The ID table is built once per loaded document and rebuilt after a
+        save, since saves may follow appends to the cached document.
+        """
+        if self._indexed is not data:
+            by_id = {}
+            for rollback in data["rollbacks"]:
+                by_id.setdefault(rollback["id"], rollback)
+            self._by_id = by_id
+            self._indexed = data
+        return self._by_id.get(rollback_id)
 
     def get_recent_rollbacks(self, repository: str, limit: int = 10) -> List[Dict]:
         """Get recent rollbacks for a repository."""
@@ -273,7 +343,7 @@ class RollbackManager:
 
         report_lines = [
             f"# Rollback Report for {repository}",
-            f"Generated at: {datetime.utcnow().isoformat()}Z",
+            f"Generated at: {datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)}",
             "",
             f"Total rollbacks: {len(recent_rollbacks)}",
             "",
@@ -346,10 +416,9 @@ class RollbackManager:
 
     def cleanup_old_rollback_records(self, days_to_keep: int = 90) -> int:
         """Clean up old rollback records to prevent file bloat."""
-        from datetime import datetime, timedelta
-
         data = self.load_rollback_history()
-        cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+        now = datetime.now(timezone.utc)
+        cutoff_date = now - timedelta(days=days_to_keep)
 
         original_count = len(data["rollbacks"])
 
@@ -364,8 +433,9 @@ class RollbackManager:
         removed_count = original_count - len(data["rollbacks"])
 
         if removed_count > 0:
-            data["metadata"]["last_cleanup"] = datetime.utcnow().isoformat() + "Z"
-            data["metadata"]["last_updated"] = datetime.utcnow().isoformat() + "Z"
+            now_iso = now.strftime(TIMESTAMP_FORMAT)
+            data["metadata"]["last_cleanup"] = now_iso
+            data["metadata"]["last_updated"] = now_iso
             self.save_rollback_history(data)
             print(f"Cleaned up {removed_count} old rollback records")
 
@@ -7,6 +7,7 @@ Runs code quality checks before allowing commits
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -161,7 +162,16 @@ class PreCommitChecker:
         print(f"Checking {len(files)} Python file(s):\n  " + "\n  ".join(files))
         print()
 
-        # Run checks
+        # Run checks. The tools are separate processes, so run them side by
+        # side; list.append keeps the shared errors/warnings safe.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            checks = [
+                executor.submit(check, files)
+                for check in (self.run_black, self.run_flake8, self.run_mypy)
+            ]
+            for check in checks:
+                check.result()
+        self.check_tests_exist(files)
 
         print("\n" + "=" * 60)
         print("📊 Pre-commit Summary")
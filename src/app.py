@@ -19,6 +19,28 @@ logger = logging.getLogger(__name__)
 MAX_PASTE_SIZE = 1024 * 1024  # 1MB in bytes
 
 
+# Clients may reuse a fetched paste for this long before revalidating
+PASTE_CACHE_MAX_AGE = 300  # seconds
+
+
+def _cacheable(response: Response, etag: str) -> Response:
+    """Attach caching headers to a paste response.
+
+    Args:
+        response: Response for a paste representation
+        etag: Entity tag identifying the paste and its format
+
+    Returns:
+        The same response with ETag, Cache-Control and Vary set
+    """
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = PASTE_CACHE_MAX_AGE
+    # The body depends on content negotiation
+    response.vary.add("Accept")
+    return response
+
+
 def create_app(
     config: Config,
     authenticator: Authenticator,
@@ -193,6 +215,7 @@ def create_app(
 
         Returns:
             200: Paste content (plain text or HTML)
+            304: Not modified (client already has this representation)
             404: Not found
             500: Internal server error
         """
@@ -205,6 +228,18 @@ def create_app(
                 mimetype="text/plain",
             )
 
+        # Determine format from Accept header
+        format_type = renderer.determine_format(request.headers.get("Accept"))
+
+        # Pastes never change once created, so the ID and format identify the
+        # response. A client revalidating its copy only needs an existence
+        # check rather than loading and rendering the content again.
+        etag = f"{paste_id}-{format_type}"
+        if request.if_none_match.contains(etag) and paste_handler.paste_exists(
+            paste_id
+        ):
+            return _cacheable(Response(status=304), etag)
+
         # Retrieve paste
         try:
             paste = paste_handler.get_paste(paste_id)
@@ -245,18 +280,16 @@ def create_app(
                 mimetype="text/plain",
             )
 
-        # Determine format from Accept header
+        # Render response
         try:
-            accept_header = request.headers.get("Accept")
-            format_type = renderer.determine_format(accept_header)
-
-            # Render response
             if format_type == "html":
                 content, content_type = renderer.render_html(paste)
             else:
                 content, content_type = renderer.render_plain_text(paste)
 
-            return Response(content, status=200, mimetype=content_type)
+            return _cacheable(
+                Response(content, status=200, mimetype=content_type), etag
+            )
         except Exception as e:
             logger.exception(f"Error rendering paste {paste_id}: {e}")
             return Response(
@@ -287,4 +320,11 @@ def run_server(
     # Listen on all interfaces - Tailscale will handle routing
     # All requests will be authenticated via LocalAPI
     logger.info(f"Starting HTTP server on all interfaces, port {config.listen_port}")
-    app.run(host="0.0.0.0", port=config.listen_port, debug=False)  # nosec B104
+    # Serve each request on its own thread so a slow LocalAPI lookup or SQLite
+    # call does not hold up other clients (Storage pools connections for this)
+    app.run(
+        host="0.0.0.0",  # nosec B104
+        port=config.listen_port,
+        debug=False,
+        threaded=True,
+    )
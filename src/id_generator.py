@@ -6,7 +6,7 @@ This module generates unique, URL-friendly paste IDs using base62 encoding
 
 import secrets
 import string
-from typing import Callable
+from typing import Callable, Optional
 
 
 class IDGenerator:
@@ -20,6 +20,9 @@ class IDGenerator:
     # Base62 alphabet: a-zA-Z0-9
     BASE62_ALPHABET = string.ascii_letters + string.digits
 
+    # Largest multiple of the alphabet size that fits in a byte (4 * 62)
+    _BYTE_LIMIT = 256 - 256 % len(BASE62_ALPHABET)
+
     def __init__(self, id_length: int = 8):
         """Initialize ID generator.
 
@@ -28,14 +31,16 @@ class IDGenerator:
         """
         self.id_length = id_length
 
-    def generate(self, exists_check: Callable[[str], bool]) -> str:
+    def generate(self, exists_check: Optional[Callable[[str], bool]] = None) -> str:
         """Generate a unique paste ID with collision detection.
 
         Generates random base62 IDs until one is found that doesn't already exist.
         Uses cryptographically secure random number generation.
 
         Args:
-            exists_check: Function that returns True if an ID already exists
+            exists_check: Function that returns True if an ID already exists.
+                If omitted, the first random ID is returned and the caller is
+                responsible for detecting collisions (e.g. a unique constraint).
 
         Returns:
             A unique paste ID string
@@ -50,7 +55,7 @@ class IDGenerator:
             paste_id = self._generate_random_id()
 
             # Check for collision
-            if not exists_check(paste_id):
+            if exists_check is None or not exists_check(paste_id):
                 return paste_id
 
         # This should be extremely rare with 8-character base62
@@ -65,6 +70,17 @@ class IDGenerator:
         Returns:
             Random ID string of specified length
         """
-        return "".join(
-            secrets.choice(self.BASE62_ALPHABET) for _ in range(self.id_length)
-        )
+        alphabet = self.BASE62_ALPHABET
+        chars: list[str] = []
+
+        # Read all the randomness for an ID at once instead of one urandom
+        # call per character. Bytes >= _BYTE_LIMIT are discarded so every
+        # character stays uniformly distributed.
+        while len(chars) < self.id_length:
+            for byte in secrets.token_bytes(self.id_length * 2):
+                if byte < self._BYTE_LIMIT:
+                    chars.append(alphabet[byte % len(alphabet)])
+                    if len(chars) == self.id_length:
+                        break
+
+        return "".join(chars)
@@ -10,7 +10,7 @@ from datetime import datetime, timezone
 from src.authenticator import WhoIsInfo
 from src.config import Config
 from src.id_generator import IDGenerator
-from src.storage import Paste, Storage
+from src.storage import DuplicatePasteError, Paste, Storage
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -29,6 +29,9 @@ class PasteHandler:
     to provide a high-level interface for paste operations.
     """
 
+    # Number of random IDs tried before giving up on inserting a paste
+    MAX_ID_ATTEMPTS = 10
+
     def __init__(self, storage: Storage, id_generator: IDGenerator, config: Config):
         """Initialize paste handler with dependencies.
 
@@ -44,9 +47,10 @@ class PasteHandler:
     def create_paste(self, content: str, source_info: WhoIsInfo) -> tuple[str, str]:
         """Create a new paste with metadata.
 
-        Generates a unique ID, constructs a Paste object with metadata
-        (timestamp, source host, source user), saves it to storage, and
-        returns the paste ID and public URL.
+        Generates a random ID, constructs a Paste object with metadata
+        (timestamp, source host, source user), saves it to storage (retrying
+        with a new ID if it is already taken), and returns the paste ID and
+        public URL.
 
         Args:
             content: The paste content
@@ -63,17 +67,6 @@ class PasteHandler:
             logger.warning("Attempted to create paste with empty content")
             raise PasteHandlerError("Paste content cannot be empty")
 
-        # Generate unique ID
-        try:
-            paste_id = self.id_generator.generate(self.storage.exists)
-            logger.debug(f"Generated paste ID: {paste_id}")
-        except RuntimeError as e:
-            logger.error(f"Failed to generate unique ID: {e}")
-            raise PasteHandlerError(f"Failed to generate unique ID: {e}")
-
-        # Get current timestamp in ISO 8601 format
-        timestamp = datetime.now(timezone.utc).isoformat()
-
         # Extract source information from WhoIsInfo
         if not source_info:
             raise PasteHandlerError(
@@ -83,22 +76,43 @@ class PasteHandler:
         source_host = source_info.node.name
         source_user = source_info.user_profile.login_name
 
-        # Construct Paste object
-        paste = Paste(
-            id=paste_id,
-            content=content,
-            created_at=timestamp,
-            source_host=source_host,
-            source_user=source_user,
-        )
+        # Get current timestamp in ISO 8601 format
+        timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Save to storage
-        try:
-            self.storage.save(paste_id, paste)
-            logger.info(f"Paste saved: {paste_id} by {source_user} from {source_host}")
-        except Exception as e:
-            logger.error(f"Failed to save paste {paste_id}: {e}")
-            raise PasteHandlerError(f"Failed to save paste: {e}")
+        # Insert under a fresh random ID and let the primary key reject the
+        # (very unlikely) collision, instead of querying for every new ID
+        for _ in range(self.MAX_ID_ATTEMPTS):
+            paste_id = self.id_generator.generate()
+            logger.debug(f"Generated paste ID: {paste_id}")
+
+            # Construct Paste object
+            paste = Paste(
+                id=paste_id,
+                content=content,
+                created_at=timestamp,
+                source_host=source_host,
+                source_user=source_user,
+            )
+
+            # Save to storage
+            try:
+                self.storage.save(paste_id, paste)
+                logger.info(
+                    f"Paste saved: {paste_id} by {source_user} from {source_host}"
+                )
+                break
+            except DuplicatePasteError:
+                logger.warning(f"Paste ID collision, retrying: {paste_id}")
+            except Exception as e:
+                logger.error(f"Failed to save paste {paste_id}: {e}")
+                raise PasteHandlerError(f"Failed to save paste: {e}")
+        else:
+            logger.error(
+                f"Failed to generate unique ID after {self.MAX_ID_ATTEMPTS} attempts"
+            )
+            raise PasteHandlerError(
+                f"Failed to generate unique ID after {self.MAX_ID_ATTEMPTS} attempts"
+            )
 
         # Generate and return paste URL
         paste_url = self._generate_url(paste_id)
@@ -127,6 +141,17 @@ class PasteHandler:
             logger.error(f"Failed to retrieve paste {paste_id}: {e}")
             raise PasteHandlerError(f"Failed to retrieve paste: {e}")
 
+    def paste_exists(self, paste_id: str) -> bool:
+        """Check whether a paste exists without loading its content.
+
+        Args:
+            paste_id: Unique paste identifier
+
+        Returns:
+            True if the paste exists, False otherwise
+        """
+        return self.storage.exists(paste_id)
+
     def _generate_url(self, paste_id: str) -> str:
         """Generate public URL for a paste.
 
@@ -4,9 +4,14 @@ This module handles persistence of paste content and metadata to a SQLite databa
 """
 
 import logging
+import queue
 import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from pathlib import Path
+from typing import Iterator
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -18,6 +23,12 @@ class StorageError(Exception):
     pass
 
 
+class DuplicatePasteError(StorageError):
+    """Raised when saving a paste whose ID is already taken."""
+
+    pass
+
+
 @dataclass
 class Paste:
     """Represents a paste with content and metadata.
@@ -57,7 +68,47 @@ class Storage:
         source_host TEXT NOT NULL,
         source_user TEXT NOT NULL
     )
+
+    Connections are kept in a small pool and reused across requests instead
+    of being opened and closed for every operation. Pastes are never modified
+    after they are saved, so recently loaded small pastes are also kept in a
+    bounded in-memory cache.
+    """
+
+    # Maximum number of idle connections kept open for reuse
+    MAX_IDLE_CONNECTIONS = 4
+
+    # Maximum number of pastes kept in the load cache
+    CACHE_MAX_ENTRIES = 256
+    # Pastes with more content characters than this are not cached, which
+    # bounds the cache to a few MB even though pastes can be up to 1MB
+    CACHE_MAX_CONTENT_LENGTH = 16 * 1024
+
+    # SQL is kept as constants so every call passes the identical string and
+    # hits each connection's prepared statement cache
+    _CREATE_TABLE_SQL = """
+        CREATE TABLE IF NOT EXISTS pastes (
+            id TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL,
+            source_host TEXT NOT NULL,
+            source_user TEXT NOT NULL
+        )
     """
+    # Serves the health check's "pastes in the last 24 hours" count, which
+    # would otherwise scan every row including its content
+    _CREATE_CREATED_AT_INDEX_SQL = (
+        "CREATE INDEX IF NOT EXISTS idx_pastes_created_at ON pastes (created_at)"
+    )
+    _INSERT_SQL = (
+        "INSERT INTO pastes (id, content, created_at, source_host, source_user) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    _SELECT_SQL = (
+        "SELECT id, content, created_at, source_host, source_user "
+        "FROM pastes WHERE id = ?"
+    )
+    _EXISTS_SQL = "SELECT 1 FROM pastes WHERE id = ? LIMIT 1"
 
     def __init__(self, database_path: str):
         """Initialize storage with database path.
@@ -69,6 +120,11 @@ class Storage:
             StorageError: If database initialization fails
         """
         self.database_path = Path(database_path)
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+            maxsize=self.MAX_IDLE_CONNECTIONS
+        )
+        self._cache: "OrderedDict[str, Paste]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         # Ensure parent directory exists
         try:
@@ -81,30 +137,91 @@ class Storage:
         # Initialize database schema
         self.initialize()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new database connection.
+
+        Returns:
+            SQLite connection usable from any thread
+        """
+        # Pooled connections move between request threads; each one is only
+        # used by a single thread at a time.
+        conn = sqlite3.connect(str(self.database_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # synchronous is per-connection; NORMAL is durable across application
+        # crashes in WAL mode and avoids an fsync on every commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool, returning it afterwards.
+
+        Yields:
+            SQLite connection reserved for the caller
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
+
+        try:
+            yield conn
+        finally:
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def _cache_get(self, paste_id: str) -> Paste | None:
+        """Return a cached paste, marking it as recently used."""
+        with self._cache_lock:
+            paste = self._cache.get(paste_id)
+            if paste is not None:
+                self._cache.move_to_end(paste_id)
+            return paste
+
+    def _cache_put(self, paste: Paste) -> None:
+        """Cache a loaded paste, evicting the least recently used one."""
+        if len(paste.content) > self.CACHE_MAX_CONTENT_LENGTH:
+            return
+        with self._cache_lock:
+            self._cache[paste.id] = paste
+            self._cache.move_to_end(paste.id)
+            if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
     def initialize(self) -> None:
         """Create database and schema if not exists.
 
-        Creates the pastes table with the required schema.
+        Creates the pastes table with the required schema and switches the
+        database to write-ahead logging so readers do not block the writer.
 
         Raises:
             StorageError: If schema initialization fails
         """
         try:
-            conn = sqlite3.connect(str(self.database_path))
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS pastes (
-                    id TEXT PRIMARY KEY,
-                    content TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL,
-                    source_host TEXT NOT NULL,
-                    source_user TEXT NOT NULL
-                )
-            """)
+            with self._connection() as conn:
+                # journal_mode is persistent, so this only has to happen once
+                journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if journal_mode.lower() != "wal":
+                    logger.warning(
+                        f"SQLite WAL mode unavailable, using journal_mode={journal_mode}"
+                    )
+
+            with self._connection() as conn, conn:
+                conn.execute(self._CREATE_TABLE_SQL)
+                conn.execute(self._CREATE_CREATED_AT_INDEX_SQL)
 
-            conn.commit()
-            conn.close()
             logger.debug("Database schema initialized successfully")
 
         except sqlite3.Error as e:
@@ -124,33 +241,29 @@ class Storage:
             paste: Paste object to save
 
         Raises:
+            DuplicatePasteError: If a paste with this ID already exists
             StorageError: If save operation fails
         """
         try:
-            conn = sqlite3.connect(str(self.database_path))
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                INSERT INTO pastes (id, content, created_at, source_host, source_user)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (
-                    paste.id,
-                    paste.content,
-                    paste.created_at,
-                    paste.source_host,
-                    paste.source_user,
-                ),
-            )
+            # The inner "with conn" commits, or rolls back on error so a failed
+            # insert does not leave a transaction open on the pooled connection
+            with self._connection() as conn, conn:
+                conn.execute(
+                    self._INSERT_SQL,
+                    (
+                        paste.id,
+                        paste.content,
+                        paste.created_at,
+                        paste.source_host,
+                        paste.source_user,
+                    ),
+                )
 
-            conn.commit()
-            conn.close()
             logger.debug(f"Paste saved to database: {paste_id}")
 
         except sqlite3.IntegrityError as e:
             logger.warning(f"Attempted to save duplicate paste ID: {paste_id}")
-            raise StorageError(f"Paste with ID {paste_id} already exists: {e}")
+            raise DuplicatePasteError(f"Paste with ID {paste_id} already exists: {e}")
         except sqlite3.Error as e:
             logger.error(f"Database error saving paste {paste_id}: {e}")
             raise StorageError(f"Failed to save paste {paste_id}: {e}")
@@ -172,35 +285,29 @@ class Storage:
         Raises:
             StorageError: If paste doesn't exist or load fails
         """
-        try:
-            conn = sqlite3.connect(str(self.database_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT id, content, created_at, source_host, source_user
-                FROM pastes
-                WHERE id = ?
-            """,
-                (paste_id,),
-            )
+        cached = self._cache_get(paste_id)
+        if cached is not None:
+            logger.debug(f"Paste loaded from cache: {paste_id}")
+            return cached
 
-            row = cursor.fetchone()
-            conn.close()
+        try:
+            with self._connection() as conn:
+                row = conn.execute(self._SELECT_SQL, (paste_id,)).fetchone()
 
             if row is None:
                 logger.debug(f"Paste not found in database: {paste_id}")
                 raise StorageError(f"Paste not found: {paste_id}")
 
             logger.debug(f"Paste loaded from database: {paste_id}")
-            return Paste(
+            paste = Paste(
                 id=row["id"],
                 content=row["content"],
                 created_at=row["created_at"],
                 source_host=row["source_host"],
                 source_user=row["source_user"],
             )
+            self._cache_put(paste)
+            return paste
 
         except StorageError:
             raise
@@ -220,19 +327,12 @@ class Storage:
         Returns:
             True if paste exists, False otherwise
         """
-        try:
-            conn = sqlite3.connect(str(self.database_path))
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT 1 FROM pastes WHERE id = ? LIMIT 1
-            """,
-                (paste_id,),
-            )
+        if self._cache_get(paste_id) is not None:
+            return True
 
-            result = cursor.fetchone()
-            conn.close()
+        try:
+            with self._connection() as conn:
+                result = conn.execute(self._EXISTS_SQL, (paste_id,)).fetchone()
 
             return result is not None
 
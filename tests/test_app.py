@@ -255,6 +255,63 @@ class TestFlaskApp:
         assert b"<!DOCTYPE html>" in response.data
         assert b"HTML content" in response.data
 
+    def test_get_retrieve_paste_sets_cache_headers(
+        self, client, mock_authenticator, sample_whois_info
+    ):
+        """Test that paste responses can be cached and revalidated."""
+        mock_authenticator.verify_tailnet_source.return_value = sample_whois_info
+        upload_response = client.post("/", data="Cacheable content")
+        paste_id = upload_response.get_data(as_text=True).strip().split("/")[-1]
+
+        response = client.get(f"/{paste_id}", headers={"Accept": "text/plain"})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == f'"{paste_id}-plain"'
+        assert response.cache_control.public
+        assert response.cache_control.max_age > 0
+        assert "Accept" in response.vary
+
+    def test_get_retrieve_paste_not_modified(
+        self, client, mock_authenticator, sample_whois_info, paste_handler
+    ):
+        """Test that a matching If-None-Match returns 304 without loading."""
+        mock_authenticator.verify_tailnet_source.return_value = sample_whois_info
+        upload_response = client.post("/", data="Unchanged content")
+        paste_id = upload_response.get_data(as_text=True).strip().split("/")[-1]
+        etag = client.get(f"/{paste_id}").headers["ETag"]
+        paste_handler.get_paste = Mock(side_effect=AssertionError("paste loaded"))
+
+        response = client.get(f"/{paste_id}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    def test_get_retrieve_paste_etag_depends_on_format(
+        self, client, mock_authenticator, sample_whois_info
+    ):
+        """Test that a plain text ETag does not revalidate the HTML page."""
+        mock_authenticator.verify_tailnet_source.return_value = sample_whois_info
+        upload_response = client.post("/", data="Negotiated content")
+        paste_id = upload_response.get_data(as_text=True).strip().split("/")[-1]
+        etag = client.get(f"/{paste_id}").headers["ETag"]
+
+        response = client.get(
+            f"/{paste_id}",
+            headers={"If-None-Match": etag, "Accept": "text/html"},
+        )
+
+        assert response.status_code == 200
+        assert b"<!DOCTYPE html>" in response.data
+
+    def test_get_retrieve_missing_paste_ignores_if_none_match(self, client):
+        """Test that a stale ETag for a missing paste still yields 404."""
+        response = client.get(
+            "/nonexistent123", headers={"If-None-Match": '"nonexistent123-plain"'}
+        )
+
+        assert response.status_code == 404
+
     def test_post_upload_proxy_headers_rejected(
         self, mock_authenticator, paste_handler, renderer, config
     ):
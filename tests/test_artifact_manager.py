@@ -26,6 +26,8 @@ class TestArtifactManager(unittest.TestCase):
         self.original_cwd = os.getcwd()
         os.chdir(self.temp_dir)
         self.manager = ArtifactManager()
+        # Keep tests off the network; registry tests re-enable it with a mock
+        self.manager._registry_disabled = True
 
     def tearDown(self):
         """Clean up test environment."""
@@ -101,6 +103,169 @@ class TestArtifactManager(unittest.TestCase):
         loaded_data = self.manager.load_artifacts()
         self.assertEqual(loaded_data["artifacts"]["test"]["digest"], "sha256:test")
 
+    def test_load_artifacts_reuses_parsed_file(self):
+        """Test that an unchanged artifacts file is parsed only once."""
+        self.manager.save_artifacts({"artifacts": {}, "metadata": {"version": "1.0"}})
+
+        with patch("artifact_manager.json_loads") as mock_loads:
+            first = self.manager.load_artifacts()
+            second = self.manager.load_artifacts()
+
+        mock_loads.assert_not_called()
+        self.assertIs(first, second)
+
+    def test_load_artifacts_rereads_changed_file(self):
+        """Test that a file modified by another process is parsed again."""
+        self.manager.save_artifacts({"artifacts": {}, "metadata": {"version": "1.0"}})
+        self.manager.load_artifacts()
+
+        other = ArtifactManager()
+        data = other.load_artifacts()
+        data["artifacts"]["other"] = {"digest": "sha256:other", "commit": "other123"}
+        other.save_artifacts(data)
+
+        self.assertIn("other", self.manager.load_artifacts()["artifacts"])
+
+    def test_lookups_after_multiple_records(self):
+        """Test commit/digest lookups stay correct as artifacts are added."""
+        digest_a = "sha256:" + "a" * 64
+        digest_b = "sha256:" + "b" * 64
+        self.manager.record_artifact(digest_a, "commit1", "ghcr.io", "test/repo")
+        self.assertIsNone(
+            self.manager.check_existing_artifact("docker.io", "test/repo", "commit1")
+        )
+
+        # Same commit pushed to a second registry
+        self.manager.record_artifact(digest_b, "commit1", "docker.io", "test/repo")
+        self.manager.update_artifact_status(digest_b, "deployed")
+
+        self.assertEqual(
+            self.manager.check_existing_artifact("ghcr.io", "test/repo", "commit1"),
+            digest_a,
+        )
+        self.assertEqual(
+            self.manager.check_existing_artifact("docker.io", "test/repo", "commit1"),
+            digest_b,
+        )
+        self.assertEqual(self.manager.get_digest_for_commit("commit1"), digest_a)
+        self.assertEqual(self.manager.get_artifact_status(digest_a), "created")
+        self.assertEqual(self.manager.get_artifact_status(digest_b), "deployed")
+
+    def test_apply_batch_saves_once(self):
+        """Test that a batch of writes is applied with a single save."""
+        digest = "sha256:" + "c" * 64
+        ops = [
+            {
+                "op": "record-artifact",
+                "args": {
+                    "digest": digest,
+                    "commit": "commit2",
+                    "registry": "ghcr.io",
+                    "repository": "test/repo",
+                },
+            },
+            {"op": "update-status", "args": {"digest": digest, "status": "tested"}},
+            {
+                "op": "record-test-result",
+                "args": {
+                    "digest": digest,
+                    "test_type": "unit",
+                    "status": "passed",
+                    "timestamp": "2024-01-01T00:00:00Z",
+                },
+            },
+        ]
+
+        with patch.object(
+            self.manager, "save_artifacts", wraps=self.manager.save_artifacts
+        ) as mock_save:
+            self.manager.apply_batch(ops)
+
+        mock_save.assert_called_once()
+        self.assertEqual(self.manager.get_artifact_status(digest), "tested")
+        self.assertEqual(
+            self.manager.get_test_results(digest)["unit"]["status"], "passed"
+        )
+
+    def test_apply_batch_unknown_operation_writes_nothing(self):
+        """Test that a batch with an unknown operation is rejected as a whole."""
+        ops = [
+            {
+                "op": "record-artifact",
+                "args": {
+                    "digest": "sha256:" + "d" * 64,
+                    "commit": "commit3",
+                    "registry": "ghcr.io",
+                    "repository": "test/repo",
+                },
+            },
+            {"op": "delete-everything", "args": {}},
+        ]
+
+        with self.assertRaises(SystemExit):
+            self.manager.apply_batch(ops)
+
+        self.assertFalse(Path(".artifacts.json").exists())
+
+    def test_apply_batch_failure_leaves_cache_untouched(self):
+        """Test that a failing batch doesn't leave partial edits in the cache."""
+        digest = "sha256:" + "e" * 64
+        self.manager.record_artifact(digest, "commit4", "ghcr.io", "test/repo")
+        ops = [
+            {"op": "update-status", "args": {"digest": digest, "status": "tested"}},
+            {"op": "update-status", "args": {"digest": digest, "bogus": True}},
+        ]
+
+        with self.assertRaises(SystemExit):
+            self.manager.apply_batch(ops)
+        with self.assertRaises(SystemExit):
+            self.manager.apply_batch([{"op": "update-status", "args": [digest]}])
+
+        self.assertEqual(self.manager.get_artifact_status(digest), "created")
+
+    def test_save_artifacts_failure_keeps_previous_file(self):
+        """Test that a failed save leaves the existing file intact."""
+        self.manager.save_artifacts({"artifacts": {"a": {}}, "metadata": {}})
+
+        with patch("artifact_manager.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(SystemExit):
+                self.manager.save_artifacts({"artifacts": {}, "metadata": {}})
+
+        self.assertEqual(os.listdir("."), [".artifacts.json"])
+        self.assertIn("a", ArtifactManager().load_artifacts()["artifacts"])
+
+    def test_load_artifacts_moves_corrupt_file_aside(self):
+        """Test that an unparseable artifacts file is preserved, not reset."""
+        Path(".artifacts.json").write_text('{"artifacts": {"truncated"')
+
+        with self.assertRaises(SystemExit) as context:
+            self.manager.load_artifacts()
+
+        self.assertEqual(context.exception.code, 2)
+        self.assertFalse(Path(".artifacts.json").exists())
+        corrupt_files = list(Path(".").glob(".artifacts.json.corrupt-*"))
+        self.assertEqual(len(corrupt_files), 1)
+        self.assertEqual(corrupt_files[0].read_text(), '{"artifacts": {"truncated"')
+
+    def test_repeated_updates_do_not_rewrite_file(self):
+        """Test that idempotent status and test-result updates skip the save."""
+        digest = "sha256:" + "f" * 64
+        self.manager.record_artifact(digest, "commit4", "ghcr.io", "test/repo")
+        self.manager.update_artifact_status(digest, "tested")
+        self.manager.record_test_result(
+            digest, "unit", "passed", "2024-01-01T00:00:00Z", "ok"
+        )
+
+        with patch.object(self.manager, "save_artifacts") as mock_save:
+            self.manager.update_artifact_status(digest, "tested")
+            self.manager.record_test_result(
+                digest, "unit", "passed", "2024-01-01T00:00:00Z", "ok"
+            )
+            mock_save.assert_not_called()
+
+            self.manager.update_artifact_status(digest, "deployed")
+            mock_save.assert_called_once()
+
     def test_record_artifact_invalid_digest(self):
         """Test that recording with invalid digest raises error."""
         with self.assertRaises(SystemExit):
@@ -132,6 +297,128 @@ class TestArtifactManager(unittest.TestCase):
 
         self.assertFalse(result)
 
+    @patch("artifact_manager.random.uniform", side_effect=lambda low, high: high)
+    @patch("time.sleep")
+    @patch("subprocess.run")
+    def test_validate_artifact_exists_backoff_is_jittered_and_capped(
+        self, mock_run, mock_sleep, mock_uniform
+    ):
+        """Test that retry waits are drawn from a capped exponential range."""
+        mock_run.return_value = MagicMock(returncode=1, stderr="")
+
+        digest = "sha256:" + "1" * 64
+        self.manager.validate_artifact_exists(digest, "ghcr.io", "test/repo")
+
+        ranges = [call.args for call in mock_uniform.call_args_list]
+        self.assertEqual(ranges, [(0, d) for d in (2, 4, 8, 16, 32, 60, 60)])
+        self.assertEqual(
+            [call.args[0] for call in mock_sleep.call_args_list],
+            [2, 4, 8, 16, 32, 60, 60],
+        )
+
+    def test_registry_has_manifest_uses_bearer_challenge(self):
+        """Test the registry HEAD check with a token challenge."""
+        digest = "sha256:" + "1" * 64
+        session = MagicMock()
+        session.head.side_effect = [
+            MagicMock(
+                status_code=401,
+                headers={
+                    "WWW-Authenticate": 'Bearer realm="https://ghcr.io/token",'
+                    'service="ghcr.io",scope="repository:test/repo:pull"'
+                },
+            ),
+            MagicMock(status_code=200),
+        ]
+        session.get.return_value = MagicMock(
+            status_code=200, json=MagicMock(return_value={"token": "abc"})
+        )
+        self.manager._registry_session = session
+        self.manager._registry_disabled = False
+
+        self.assertTrue(
+            self.manager.registry_has_manifest(digest, "ghcr.io", "Test/Repo")
+        )
+
+        session.get.assert_called_once()
+        self.assertEqual(
+            session.get.call_args.kwargs["params"],
+            {"service": "ghcr.io", "scope": "repository:test/repo:pull"},
+        )
+        url = session.head.call_args.args[0]
+        self.assertEqual(url, f"https://ghcr.io/v2/test/repo/manifests/{digest}")
+        headers = session.head.call_args.kwargs["headers"]
+        self.assertEqual(headers["Authorization"], "Bearer abc")
+
+    @patch.dict(os.environ, {"GH_TOKEN": "secret"})
+    def test_registry_token_only_sends_credentials_to_ghcr(self):
+        """Test that the GitHub token never goes to another registry's realm."""
+        session = MagicMock()
+        session.get.return_value = MagicMock(
+            status_code=200, json=MagicMock(return_value={"token": "abc"})
+        )
+
+        self.manager._registry_token(
+            session,
+            "registry.example.com",
+            'Bearer realm="https://auth.example.com/token",service="example.com"',
+        )
+        self.assertIsNone(session.get.call_args.kwargs["auth"])
+
+        self.manager._registry_token(
+            session, "ghcr.io", 'Bearer realm="https://ghcr.io/token",service="ghcr.io"'
+        )
+        self.assertEqual(session.get.call_args.kwargs["auth"][1], "secret")
+
+    @patch("subprocess.run")
+    def test_validate_artifact_exists_via_registry_api(self, mock_run):
+        """Test that a confirmed registry HEAD skips the docker CLI."""
+        session = MagicMock()
+        session.head.return_value = MagicMock(status_code=200)
+        self.manager._registry_session = session
+        self.manager._registry_disabled = False
+
+        digest = "sha256:" + "1" * 64
+        result = self.manager.validate_artifact_exists(digest, "ghcr.io", "test/repo")
+
+        self.assertTrue(result)
+        mock_run.assert_not_called()
+
+    @patch("time.sleep")
+    @patch("subprocess.run")
+    def test_validate_artifact_exists_registry_404_skips_docker(
+        self, mock_run, mock_sleep
+    ):
+        """Test that a registry 404 retries over HTTP without spawning docker."""
+        session = MagicMock()
+        session.head.return_value = MagicMock(status_code=404)
+        self.manager._registry_session = session
+        self.manager._registry_disabled = False
+
+        digest = "sha256:" + "1" * 64
+        result = self.manager.validate_artifact_exists(digest, "ghcr.io", "test/repo")
+
+        self.assertFalse(result)
+        mock_run.assert_not_called()
+        self.assertEqual(session.head.call_count, 8)
+
+    def test_validate_artifacts_preserves_order(self):
+        """Test that concurrent validation returns results in input order."""
+        items = [
+            {"digest": "sha256:" + c * 64, "registry": "ghcr.io", "repository": "r"}
+            for c in "abc"
+        ]
+        valid = {items[0]["digest"], items[2]["digest"]}
+
+        with patch.object(
+            self.manager,
+            "validate_artifact_exists",
+            side_effect=lambda digest, registry, repository: digest in valid,
+        ):
+            results = self.manager.validate_artifacts(items)
+
+        self.assertEqual(results, [True, False, True])
+
     def test_generate_content_hash(self):
         """Test content hash generation."""
         # Create a test file
@@ -150,6 +437,12 @@ class TestArtifactManager(unittest.TestCase):
         content_hash2 = self.manager.generate_content_hash(str(test_file))
         self.assertEqual(content_hash, content_hash2)
 
+        # Verify value
+        self.assertEqual(
+            content_hash,
+            "sha256:dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f",
+        )
+
     def test_update_artifact_status(self):
         """Test updating artifact status."""
         digest = (
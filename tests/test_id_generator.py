@@ -46,3 +46,14 @@ class TestIDGeneratorProperties:
         assert (
             len(generated_ids) == num_pastes
         ), f"Expected {num_pastes} unique IDs, got {len(generated_ids)}"
+
+    @settings(max_examples=100)
+    @given(st.integers(min_value=1, max_value=64))
+    def test_generated_ids_are_base62_of_requested_length(self, id_length):
+        """Generated IDs have the configured length and use only base62."""
+        generator = IDGenerator(id_length=id_length)
+
+        paste_id = generator.generate(lambda _: False)
+
+        assert len(paste_id) == id_length
+        assert set(paste_id) <= set(IDGenerator.BASE62_ALPHABET)
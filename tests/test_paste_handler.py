@@ -6,6 +6,7 @@ storage integration, and URL generation.
 
 import tempfile
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -149,6 +150,46 @@ class TestPasteHandler:
         # All IDs should be unique
         assert len(ids) == 10
 
+    def test_create_paste_retries_on_id_collision(
+        self, temp_storage, config_with_custom_domain, sample_whois_info
+    ):
+        """Test that an ID already in storage is replaced by a fresh one."""
+        handler = PasteHandler(
+            storage=temp_storage,
+            id_generator=IDGenerator(),
+            config=config_with_custom_domain,
+        )
+        taken_id, _ = handler.create_paste("First", sample_whois_info)
+
+        id_generator = Mock(spec=IDGenerator)
+        id_generator.generate.side_effect = [taken_id, "freshid1"]
+        handler.id_generator = id_generator
+
+        paste_id, _ = handler.create_paste("Second", sample_whois_info)
+
+        assert paste_id == "freshid1"
+        assert temp_storage.load(taken_id).content == "First"
+        assert temp_storage.load("freshid1").content == "Second"
+
+    def test_create_paste_gives_up_after_repeated_collisions(
+        self, temp_storage, config_with_custom_domain, sample_whois_info
+    ):
+        """Test that persistent ID collisions raise PasteHandlerError."""
+        handler = PasteHandler(
+            storage=temp_storage,
+            id_generator=IDGenerator(),
+            config=config_with_custom_domain,
+        )
+        taken_id, _ = handler.create_paste("First", sample_whois_info)
+
+        id_generator = Mock(spec=IDGenerator)
+        id_generator.generate.return_value = taken_id
+        handler.id_generator = id_generator
+
+        with pytest.raises(PasteHandlerError, match="Failed to generate unique ID"):
+            handler.create_paste("Second", sample_whois_info)
+        assert id_generator.generate.call_count == PasteHandler.MAX_ID_ATTEMPTS
+
     def test_get_paste_success(
         self, temp_storage, config_with_custom_domain, sample_whois_info
     ):
@@ -8,6 +8,7 @@ import tempfile
 import os
 from hypothesis import given, strategies as st, settings
 from datetime import datetime
+from unittest.mock import Mock
 
 from src.storage import Storage, Paste, StorageError
 
@@ -230,3 +231,98 @@ class TestStorageUnitTests:
 
         assert loaded_paste.content == large_content
         assert len(loaded_paste.content) == 100000
+
+    def test_connections_are_reused_between_operations(self, temp_storage):
+        """Test that operations borrow pooled connections instead of reconnecting."""
+        with temp_storage._connection() as first:
+            pass
+        with temp_storage._connection() as second:
+            pass
+
+        assert first is second
+
+    def test_failed_save_does_not_leave_open_transaction(self, temp_storage):
+        """Test that a rejected duplicate save rolls back its pooled connection."""
+        paste = Paste(
+            id="rollback1",
+            content="Original",
+            created_at="2024-01-01T12:00:00",
+            source_host="test-host",
+            source_user="test@example.com",
+        )
+        temp_storage.save("rollback1", paste)
+
+        with pytest.raises(StorageError):
+            temp_storage.save("rollback1", paste)
+
+        with temp_storage._connection() as conn:
+            assert conn.in_transaction is False
+
+    def test_close_releases_idle_connections(self, temp_storage):
+        """Test that close() empties the pool and later operations still work."""
+        assert temp_storage.exists("missing") is False
+
+        temp_storage.close()
+
+        assert temp_storage._pool.empty()
+        assert temp_storage.exists("missing") is False
+
+    def test_database_uses_wal_journal_mode(self, temp_storage):
+        """Test that initialization switches the database to WAL mode."""
+        with temp_storage._connection() as conn:
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert journal_mode == "wal"
+
+    def test_recent_paste_count_uses_created_at_index(self, temp_storage):
+        """Test that counting recent pastes does not scan the whole table."""
+        with temp_storage._connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM pastes "
+                "WHERE created_at > datetime('now', '-24 hours')"
+            ).fetchall()
+
+        assert any("idx_pastes_created_at" in row["detail"] for row in plan)
+
+    def test_load_caches_small_pastes(self, temp_storage):
+        """Test that a loaded paste is served from memory afterwards."""
+        paste = Paste(
+            id="cached01",
+            content="Cached content",
+            created_at="2024-01-01T00:00:00+00:00",
+            source_host="test-host",
+            source_user="test@example.com",
+        )
+        temp_storage.save(paste.id, paste)
+        temp_storage.load(paste.id)
+
+        # Drop the idle connections; a cache hit must not need a new one
+        temp_storage.close()
+        temp_storage._open_connection = Mock(side_effect=AssertionError("db hit"))
+
+        assert temp_storage.load(paste.id) == paste
+        assert temp_storage.exists(paste.id) is True
+
+    def test_load_cache_is_bounded(self, temp_storage):
+        """Test that the cache skips large pastes and evicts old entries."""
+        temp_storage.CACHE_MAX_ENTRIES = 2
+        large = "x" * (temp_storage.CACHE_MAX_CONTENT_LENGTH + 1)
+        for paste_id, content in [
+            ("large001", large),
+            ("small001", "a"),
+            ("small002", "b"),
+            ("small003", "c"),
+        ]:
+            temp_storage.save(
+                paste_id,
+                Paste(
+                    id=paste_id,
+                    content=content,
+                    created_at="2024-01-01T00:00:00+00:00",
+                    source_host="test-host",
+                    source_user="test@example.com",
+                ),
+            )
+            temp_storage.load(paste_id)
+
+        assert list(temp_storage._cache) == ["small002", "small003"]